@@ -9,16 +9,23 @@ from chess import Outcome, _BoardState  # pyright: ignore[reportPrivateUsage]
 from valanga import Color
 
 from atomheart.games.chess.move.imove import MoveKey
-from atomheart.games.chess.move.utils import MoveUci
+from atomheart.games.chess.move.utils import MoveUci, intern_uci
 from atomheart.utils.logger import chipiron_logger
 
 from .board_modification import (
+    BitboardSnapshot,
     BoardModification,
     BoardModificationP,
+    LazyBoardModification,
     PieceInSquare,
-    compute_modifications,
 )
-from .iboard import BoardKey, IBoard, LegalMoveKeyGeneratorP, compute_key
+from .iboard import (
+    BOARD_KEY_STRUCT,
+    BoardInvariantError,
+    BoardKey,
+    IBoard,
+    LegalMoveKeyGeneratorP,
+)
 from .utils import Fen, FenPlusHistory
 
 
@@ -28,6 +35,13 @@ class LegalMoveKeyGenerator(LegalMoveKeyGeneratorP):
     generated_moves: dict[MoveKey, chess.Move]
     all_generated_keys_: list[MoveKey] | None
 
+    # reverse of get_uci_from_move_key, built on the first lookup
+    uci_to_key_: dict[MoveUci, MoveKey] | None
+
+    # uci of the move keys already asked for, as labelling a node or replaying moves asks
+    # for the same keys again (None until the first lookup)
+    key_to_uci_: dict[MoveKey, MoveUci] | None
+
     # whether to sort the legal_moves by their respective uci for easy comparison of various implementations
     sort_legal_moves: bool = False
 
@@ -52,6 +66,8 @@ class LegalMoveKeyGenerator(LegalMoveKeyGeneratorP):
         self.sort_legal_moves = sort_legal_moves
         self.count = 0
         self.all_generated_keys_ = None
+        self.uci_to_key_ = None
+        self.key_to_uci_ = None
 
     def get_uci_from_move_key(self, move_key: MoveKey) -> MoveUci:
         """Return the UCI string corresponding to the given move key.
@@ -63,8 +79,37 @@ class LegalMoveKeyGenerator(LegalMoveKeyGeneratorP):
             moveUci: The UCI string corresponding to the given move key.
 
         """
-        chess_move: chess.Move = self.generated_moves[move_key]
-        return chess_move.uci()
+        key_to_uci = self.key_to_uci_
+        if key_to_uci is None:
+            key_to_uci = self.key_to_uci_ = {}
+        move_uci = key_to_uci.get(move_key)
+        if move_uci is None:
+            chess_move: chess.Move = self.generated_moves[move_key]
+            move_uci = key_to_uci[move_key] = intern_uci(chess_move.uci())
+        return move_uci
+
+    def get_move_key_from_uci(self, move_uci: MoveUci) -> MoveKey:
+        """Return the move key corresponding to the given UCI string.
+
+        Args:
+            move_uci (MoveUci): The UCI string to convert to a move key.
+
+        Returns:
+            MoveKey: The move key corresponding to the given UCI string.
+
+        Raises:
+            BoardInvariantError: If the UCI string is not found in the legal moves.
+
+        """
+        if self.uci_to_key_ is None:
+            self.uci_to_key_ = {
+                self.get_uci_from_move_key(move_key): move_key
+                for move_key in self.get_all()
+            }
+        try:
+            return self.uci_to_key_[move_uci]
+        except KeyError:
+            raise BoardInvariantError from None
 
     @property
     def fen(self) -> Fen:
@@ -91,6 +136,9 @@ class LegalMoveKeyGenerator(LegalMoveKeyGeneratorP):
         """Return an iterator over the legal move keys."""
         self.it = self.chess_board.generate_legal_moves()
         self.count = 0
+        # the moves are generated again from the board, which may have changed since
+        self.key_to_uci_ = None
+        self.uci_to_key_ = None
         return self
 
     def __next__(self) -> MoveKey:
@@ -140,6 +188,8 @@ class LegalMoveKeyGenerator(LegalMoveKeyGeneratorP):
         self.generated_moves = {}
         self.count = 0
         self.all_generated_keys_ = None
+        self.uci_to_key_ = None
+        self.key_to_uci_ = None
 
     def copy_with_reset(self) -> Self:
         """Return a copy of the LegalMoveKeyGenerator with the iterator reset."""
@@ -151,9 +201,7 @@ class LegalMoveKeyGenerator(LegalMoveKeyGeneratorP):
         """Return a list of all legal move keys."""
         if self.all_generated_keys is None:
             if self.sort_legal_moves:
-                list_keys = sorted(
-                    list(self), key=lambda i: self.generated_moves[i].uci()
-                )
+                list_keys = sorted(list(self), key=self.get_uci_from_move_key)
             else:
                 list_keys = list(self)
             self.all_generated_keys_ = list_keys
@@ -186,7 +234,9 @@ class BoardChi(IBoard):
     chess_board: chess.Board
     compute_board_modification: bool
     legal_moves_: LegalMoveKeyGenerator
-    fast_representation_: BoardKey
+
+    # the key is only built when it is first read after a move (None until then)
+    _fast_representation: BoardKey | None
 
     # whether to sort the legal_moves by their respective uci for easy comparison of various implementations
     sort_legal_moves: bool
@@ -195,7 +245,7 @@ class BoardChi(IBoard):
         self,
         chess_board: chess.Board,
         compute_board_modification: bool,
-        fast_representation_: BoardKey,
+        fast_representation_: BoardKey | None,
         legal_moves_: LegalMoveKeyGenerator,
     ) -> None:
         """Initialize a new instance of the BoardChi class.
@@ -203,15 +253,44 @@ class BoardChi(IBoard):
         Args:
             chess_board: The chess.Board object to wrap.
             compute_board_modification: Whether to compute board modifications when playing moves.
-            fast_representation_: A cached fast representation of the board state.
+            fast_representation_: A cached fast representation of the board state, or None to build it
+                from the board when it is first needed.
             legal_moves_: The legal move generator to use.
 
         """
         self.chess_board = chess_board
         self.compute_board_modification = compute_board_modification
-        self.fast_representation_ = fast_representation_
+        self._fast_representation = fast_representation_
         self.legal_moves_ = legal_moves_
 
+    @property
+    def fast_representation_(self) -> BoardKey:
+        """Return the key of the current position, building it if a move invalidated it."""
+        if self._fast_representation is None:
+            chess_board: chess.Board = self.chess_board
+            ep_square = chess_board.ep_square
+            self._fast_representation = BOARD_KEY_STRUCT.pack(
+                chess_board.pawns,
+                chess_board.knights,
+                chess_board.bishops,
+                chess_board.rooks,
+                chess_board.queens,
+                chess_board.kings,
+                chess_board.turn,
+                chess_board.castling_rights,
+                -1 if ep_square is None else ep_square,
+                chess_board.occupied_co[chess.WHITE],
+                chess_board.occupied_co[chess.BLACK],
+                chess_board.promoted,
+                chess_board.fullmove_number,
+                chess_board.halfmove_clock,
+            )
+        return self._fast_representation
+
+    @fast_representation_.setter
+    def fast_representation_(self, fast_representation: BoardKey) -> None:
+        self._fast_representation = fast_representation
+
     def play_mon(self, move: chess.Move) -> None:
         """Plays a move on the board.
 
@@ -241,43 +320,33 @@ class BoardChi(IBoard):
             if not use_compute_modification_function:
                 board_modifications = self.push_and_return_modification(move)
             else:
-                previous_pawns = self.chess_board.pawns
-                previous_kings = self.chess_board.kings
-                previous_queens = self.chess_board.queens
-                previous_rooks = self.chess_board.rooks
-                previous_bishops = self.chess_board.bishops
-                previous_knights = self.chess_board.knights
-                previous_occupied_white = self.chess_board.occupied_co[chess.WHITE]
-                previous_occupied_black = self.chess_board.occupied_co[chess.BLACK]
+                chess_board = self.chess_board
+                previous: BitboardSnapshot = (
+                    chess_board.pawns,
+                    chess_board.knights,
+                    chess_board.bishops,
+                    chess_board.rooks,
+                    chess_board.queens,
+                    chess_board.kings,
+                    chess_board.occupied_co[chess.BLACK],
+                    chess_board.occupied_co[chess.WHITE],
+                )
 
                 self.play_mon(move)
 
-                new_pawns = self.chess_board.pawns
-                new_kings = self.chess_board.kings
-                new_queens = self.chess_board.queens
-                new_rooks = self.chess_board.rooks
-                new_bishops = self.chess_board.bishops
-                new_knights = self.chess_board.knights
-                new_occupied_white = self.chess_board.occupied_co[chess.WHITE]
-                new_occupied_black = self.chess_board.occupied_co[chess.BLACK]
-
-                board_modifications = compute_modifications(
-                    previous_bishops=previous_bishops,
-                    previous_pawns=previous_pawns,
-                    previous_kings=previous_kings,
-                    previous_knights=previous_knights,
-                    previous_queens=previous_queens,
-                    previous_occupied_white=previous_occupied_white,
-                    previous_rooks=previous_rooks,
-                    previous_occupied_black=previous_occupied_black,
-                    new_kings=new_kings,
-                    new_bishops=new_bishops,
-                    new_pawns=new_pawns,
-                    new_queens=new_queens,
-                    new_rooks=new_rooks,
-                    new_knights=new_knights,
-                    new_occupied_black=new_occupied_black,
-                    new_occupied_white=new_occupied_white,
+                # the diff is only computed if the modifications are read
+                board_modifications = LazyBoardModification(
+                    previous=previous,
+                    new=(
+                        chess_board.pawns,
+                        chess_board.knights,
+                        chess_board.bishops,
+                        chess_board.rooks,
+                        chess_board.queens,
+                        chess_board.kings,
+                        chess_board.occupied_co[chess.BLACK],
+                        chess_board.occupied_co[chess.WHITE],
+                    ),
                 )
         else:
             self.chess_board.push(move)
@@ -287,23 +356,8 @@ class BoardChi(IBoard):
             self.legal_moves_.copy_with_reset()
         )  # the legals moves needs to be recomputed as the board has changed
 
-        fast_representation: BoardKey = compute_key(
-            pawns=self.chess_board.pawns,
-            knights=self.chess_board.knights,
-            bishops=self.chess_board.bishops,
-            rooks=self.chess_board.rooks,
-            queens=self.chess_board.queens,
-            kings=self.chess_board.kings,
-            turn=self.chess_board.turn,
-            castling_rights=self.chess_board.castling_rights,
-            ep_square=self.chess_board.ep_square,
-            white=self.chess_board.occupied_co[chess.WHITE],
-            black=self.chess_board.occupied_co[chess.BLACK],
-            promoted=self.chess_board.promoted,
-            fullmove_number=self.chess_board.fullmove_number,
-            halfmove_clock=self.chess_board.halfmove_clock,
-        )
-        self.fast_representation_ = fast_representation
+        # the key is rebuilt lazily, as many played positions are never looked up
+        self._fast_representation = None
         return board_modifications
 
     def play_move_uci(self, move_uci: MoveUci) -> BoardModificationP | None:
@@ -337,6 +391,10 @@ class BoardChi(IBoard):
         """Rewinds the board state to the previous move."""
         if self.ply() > 0:
             self.chess_board.pop()
+            self._fast_representation = None
+            # as after playing a move, the legal moves and their uci lookups are those of
+            # another position
+            self.legal_moves_ = self.legal_moves_.copy_with_reset()
         else:
             chipiron_logger.warning(
                 "Cannot rewind more as self.halfmove_clock equals %d", self.ply()
@@ -710,12 +768,17 @@ class BoardChi(IBoard):
 
         """
         result: dict[chess.Square, tuple[int, bool]] = {}
-        for square in chess.scan_reversed(self.chess_board.occupied & mask):
+        occupied: chess.Bitboard = self.chess_board.occupied & mask
+        # squares are visited from the highest to the lowest as chess.scan_reversed does,
+        # without going through a generator
+        while occupied:
+            square: chess.Square = occupied.bit_length() - 1
             piece_type: int | None = self.chess_board.piece_type_at(square)
             assert piece_type is not None
-            mask = chess.BB_SQUARES[square]
-            color = bool(self.chess_board.occupied_co[bool(Color.WHITE)] & mask)
+            square_mask = chess.BB_SQUARES[square]
+            color = bool(self.chess_board.occupied_co[bool(Color.WHITE)] & square_mask)
             result[square] = (piece_type, color)
+            occupied ^= square_mask
         return result
 
     def has_castling_rights(self, color: chess.Color) -> bool:
@@ -781,7 +844,7 @@ class BoardChi(IBoard):
         return BoardChi(
             chess_board=chess_board_copy,
             compute_board_modification=self.compute_board_modification,
-            fast_representation_=self.fast_representation_,
+            fast_representation_=self._fast_representation,
             legal_moves_=legal_moves_copy,
         )
 
@@ -1,66 +1,96 @@
 """Module that contains the BoardModification class."""
 
-from collections.abc import Iterator
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Protocol
+from functools import cached_property
+from typing import NamedTuple, Protocol
 
 import chess
 
 
-class IteratorNotInitializedError(TypeError):
-    """Raise when a piece iterator is used before initialization."""
-
-    def __init__(self) -> None:
-        """Initialize the iterator error message."""
-        super().__init__("Iterator not initialized. Call iter() first.")
-
-
-@dataclass(frozen=True)
-class PieceInSquare:
+class PieceInSquare(NamedTuple):
     """Represents a piece on a chessboard square."""
 
     square: chess.Square
     piece: chess.PieceType
     color: chess.Color
 
+    @classmethod
+    def decode(cls, encoded: int) -> "PieceInSquare":
+        """Build the PieceInSquare from its packed int form.
+
+        Args:
+            encoded: The value returned by encode_piece_in_square.
+
+        Returns:
+            PieceInSquare: The decoded piece in square.
+
+        """
+        return cls(encoded & 0x3F, (encoded >> 6) & 0b111, bool(encoded >> 9))
+
+
+def encode_piece_in_square(
+    square: chess.Square, piece: chess.PieceType, color: chess.Color
+) -> int:
+    """Pack a square, a piece type and a color into a single int.
+
+    The square takes the 6 lowest bits, the piece type the next 3 bits and the color
+    the 10th bit.
+
+    Args:
+        square: The square of the piece.
+        piece: The type of the piece.
+        color: The color of the piece.
+
+    Returns:
+        int: The packed representation.
+
+    """
+    return square | (piece << 6) | (color << 9)
+
 
 class BoardModificationP(Protocol):
     """Represents a modification to a chessboard resulting from a move."""
 
     @property
-    def removals(self) -> Iterator[PieceInSquare]:
-        """Yields all piece removals from the board modification.
+    def removals(self) -> tuple[PieceInSquare, ...]:
+        """Return all piece removals from the board modification.
 
-        Yields:
-            Iterator[PieceInSquare]: An iterator over the piece removals.
+        Returns:
+            tuple[PieceInSquare, ...]: The piece removals.
 
         """
         ...
 
     @property
-    def appearances(self) -> Iterator[PieceInSquare]:
-        """Yields all piece appearances from the board modification.
+    def appearances(self) -> tuple[PieceInSquare, ...]:
+        """Return all piece appearances from the board modification.
 
         Returns:
-            _type_: _description_
-
-        Yields:
-            Iterator[PieceInSquare]: An iterator over the piece appearances.
+            tuple[PieceInSquare, ...]: The piece appearances.
 
         """
         ...
 
 
-def _piece_set() -> set[PieceInSquare]:
-    return set()
+def _encoded_piece_list() -> list[int]:
+    return []
 
 
 @dataclass
 class BoardModification:
-    """Represents a modification to a chessboard resulting from a move."""
+    """Represents a modification to a chessboard resulting from a move.
+
+    A move never removes (or adds) the same piece on the same square twice, so the
+    changes are simply appended to lists instead of being hashed into sets.
+    The changes are stored packed with encode_piece_in_square and PieceInSquare
+    objects are only created the first time the removals or appearances are read;
+    they are then cached so that later reads are plain attribute lookups.
+    """
 
-    removals_: set[PieceInSquare] = field(default_factory=_piece_set)
-    appearances_: set[PieceInSquare] = field(default_factory=_piece_set)
+    removals_: list[int] = field(default_factory=_encoded_piece_list)
+    appearances_: list[int] = field(default_factory=_encoded_piece_list)
 
     def add_appearance(self, appearance: PieceInSquare) -> None:
         """Add a piece appearance to the board modification.
@@ -69,7 +99,8 @@ class BoardModification:
             appearance: The PieceInSquare object representing the appearance to add.
 
         """
-        self.appearances_.add(appearance)
+        self.appearances_.append(encode_piece_in_square(*appearance))
+        self.__dict__.pop("appearances", None)
 
     def add_removal(self, removal: PieceInSquare) -> None:
         """Add a piece removal to the board modification.
@@ -78,85 +109,178 @@ class BoardModification:
             removal: The PieceInSquare object representing the removal to add.
 
         """
-        self.removals_.add(removal)
+        self.removals_.append(encode_piece_in_square(*removal))
+        self.__dict__.pop("removals", None)
 
-    @property
-    def removals(self) -> Iterator[PieceInSquare]:
-        """Yields all piece removals from the board modification.
+    @cached_property
+    def removals(self) -> tuple[PieceInSquare, ...]:
+        """Return all piece removals from the board modification.
 
         Returns:
-            Iterator[PieceInSquare]: An iterator over the piece removals.
+            tuple[PieceInSquare, ...]: The piece removals.
 
         """
-        return iter(self.removals_)
+        return tuple(map(PieceInSquare.decode, self.removals_))
 
-    @property
-    def appearances(self) -> Iterator[PieceInSquare]:
-        """Yields all piece appearances from the board modification.
+    @cached_property
+    def appearances(self) -> tuple[PieceInSquare, ...]:
+        """Return all piece appearances from the board modification.
 
         Returns:
-            Iterator[PieceInSquare]: An iterator over the piece appearances.
+            tuple[PieceInSquare, ...]: The piece appearances.
 
         """
-        return iter(self.appearances_)
+        return tuple(map(PieceInSquare.decode, self.appearances_))
 
 
-def _rust_item_set() -> set[tuple[int, int, int]]:
+def _rust_pieces(items: set[tuple[int, int, int]]) -> Iterator[PieceInSquare]:
+    """Yield the PieceInSquare objects of (square, piece, color) tuples from the Rust binding."""
+    for square, piece, color in items:
+        yield PieceInSquare(square, piece, bool(color))
+
+
+def _rust_tuple_set() -> set[tuple[int, int, int]]:
     return set()
 
 
 @dataclass
-class PieceRustIterator:
-    """Iterator over PieceInSquare objects stored as tuples for Rust compatibility."""
+class BoardModificationRust:
+    """Represents a modification to a chessboard resulting from a move.
+
+    The bitboard diff is not computed in Python for the Rust board: it comes already
+    computed from shakmaty_python_binding (MyChess.play_and_return_modifications) as
+    (square, piece, color) tuples, which are only wrapped here.
+    """
+
+    removals_: set[tuple[int, int, int]] = field(default_factory=_rust_tuple_set)
+    appearances_: set[tuple[int, int, int]] = field(default_factory=_rust_tuple_set)
+
+    @cached_property
+    def removals(self) -> tuple[PieceInSquare, ...]:
+        """Return all piece removals from the board modification.
+
+        Returns:
+            tuple[PieceInSquare, ...]: The piece removals.
+
+        """
+        return tuple(_rust_pieces(self.removals_))
+
+    @cached_property
+    def appearances(self) -> tuple[PieceInSquare, ...]:
+        """Return all piece appearances from the board modification.
 
-    items_: set[tuple[int, int, int]] = field(default_factory=_rust_item_set)
-    _it: Iterator[tuple[int, int, int]] | None = field(
-        init=False, default=None, repr=False
+        Returns:
+            tuple[PieceInSquare, ...]: The piece appearances.
+
+        """
+        return tuple(_rust_pieces(self.appearances_))
+
+
+# Bitboards of a board snapshot ordered by piece type (pawn to king, so that
+# index + 1 is the chess.PieceType) followed by the black and white occupancies
+# (so that index - 6 is the chess.Color). Any sequence of 8 ints works: a tuple is
+# the fastest to index, while an array("Q") keeps a batch of snapshots compact and
+# can be shared without copy with array libraries through the buffer protocol.
+type BitboardSnapshot = Sequence[int]
+
+# for each piece plane of a snapshot, the index of each color plane together with the
+# encode_piece_in_square bits of that piece and color, so that the kernel does not
+# rebuild them on every call
+_PIECE_PLANES: tuple[tuple[int, tuple[tuple[int, int], ...]], ...] = tuple(
+    (
+        piece_index,
+        tuple(
+            (6 + color, encode_piece_in_square(0, piece_index + 1, bool(color)))
+            for color in (0, 1)
+        ),
     )
+    for piece_index in range(6)
+)
 
-    def __iter__(self) -> "PieceRustIterator":
-        """Initialize iteration over the stored Rust tuples."""
-        self._it = iter(self.items_)
-        return self
 
-    def __next__(self) -> PieceInSquare:
-        """Return the next piece-in-square entry from the iterator."""
-        if self._it is None:
-            raise IteratorNotInitializedError
-        square, piece, color = next(self._it)
-        return PieceInSquare(square=square, piece=piece, color=bool(color))
+def _diff_kernel(
+    previous: BitboardSnapshot, new: BitboardSnapshot
+) -> tuple[list[int], list[int]]:
+    """Compute the raw bit-level differences between two board snapshots.
 
+    The kernel only works on plain ints: each changed square is reported in the
+    packed form of encode_piece_in_square, which is what BoardModification stores.
+    A move only touches a few piece types, so the squares whose color changed are
+    computed once for all planes and the piece types that are left untouched are
+    skipped without looking at their colors.
 
-def _rust_tuple_set() -> set[tuple[int, int, int]]:
-    return set()
+    Args:
+        previous: The bitboards of the previous board state.
+        new: The bitboards of the new board state.
+
+    Returns:
+        tuple[list[int], list[int]]: The encoded removals and appearances.
+
+    """
+    removals: list[int] = []
+    appearances: list[int] = []
+    color_changes = (previous[6] ^ new[6]) | (previous[7] ^ new[7])
+    for piece_index, color_planes in _PIECE_PLANES:
+        previous_piece = previous[piece_index]
+        new_piece = new[piece_index]
+        if previous_piece == new_piece and not previous_piece & color_changes:
+            continue
+        for color_index, code in color_planes:
+            previous_squares = previous_piece & previous[color_index]
+            new_squares = new_piece & new[color_index]
+            changed = previous_squares ^ new_squares
+            if not changed:
+                continue
+
+            removed = changed & previous_squares
+            while removed:
+                lowest_bit = removed & -removed
+                removals.append((lowest_bit.bit_length() - 1) | code)
+                removed ^= lowest_bit
+
+            appeared = changed & new_squares
+            while appeared:
+                lowest_bit = appeared & -appeared
+                appearances.append((lowest_bit.bit_length() - 1) | code)
+                appeared ^= lowest_bit
+    return removals, appearances
 
 
 @dataclass
-class BoardModificationRust:
-    """Represents a modification to a chessboard resulting from a move."""
+class LazyBoardModification:
+    """Represents a modification to a chessboard resulting from a move.
 
-    removals_: set[tuple[int, int, int]] = field(default_factory=_rust_tuple_set)
-    appearances_: set[tuple[int, int, int]] = field(default_factory=_rust_tuple_set)
+    Only the bitboard snapshots before and after the move are kept: the diff kernel
+    runs the first time the removals or appearances are read, so nothing is computed
+    for the moves whose modifications are never looked at.
+    """
 
-    @property
-    def removals(self) -> Iterator[PieceInSquare]:
-        """Yields all piece removals from the board modification.
+    previous: BitboardSnapshot
+    new: BitboardSnapshot
+
+    @cached_property
+    def _encoded_changes(self) -> tuple[list[int], list[int]]:
+        return _diff_kernel(self.previous, self.new)
+
+    @cached_property
+    def removals(self) -> tuple[PieceInSquare, ...]:
+        """Return all piece removals from the board modification.
 
         Returns:
-            Iterator[PieceInSquare]: An iterator over the piece removals.
+            tuple[PieceInSquare, ...]: The piece removals.
 
         """
-        return PieceRustIterator(self.removals_)
+        return tuple(map(PieceInSquare.decode, self._encoded_changes[0]))
 
-    @property
-    def appearances(self) -> Iterator[PieceInSquare]:
-        """Yields all piece appearances from the board modification.
+    @cached_property
+    def appearances(self) -> tuple[PieceInSquare, ...]:
+        """Return all piece appearances from the board modification.
 
         Returns:
-            Iterator[PieceInSquare]: An iterator over the piece appearances.
+            tuple[PieceInSquare, ...]: The piece appearances.
 
         """
-        return PieceRustIterator(self.appearances_)
+        return tuple(map(PieceInSquare.decode, self._encoded_changes[1]))
 
 
 def compute_modifications(
@@ -201,39 +325,100 @@ def compute_modifications(
         BoardModification: The computed board modifications.
 
     """
-    board_modifications: BoardModification = BoardModification()
-    hop = [
-        (previous_pawns, new_pawns, chess.PAWN),
-        (previous_bishops, new_bishops, chess.BISHOP),
-        (previous_rooks, new_rooks, chess.ROOK),
-        (previous_knights, new_knights, chess.KNIGHT),
-        (previous_queens, new_queens, chess.QUEEN),
-        (previous_kings, new_kings, chess.KING),
-    ]
-    hip = [
-        (previous_occupied_white, new_occupied_white, chess.WHITE),
-        (previous_occupied_black, new_occupied_black, chess.BLACK),
-    ]
-
-    for previous_bitboard_piece, new_bitboard_piece, piece_type in hop:
-        for previous_bitboard_color, new_bitboard_color, color in hip:
-            removals: chess.Bitboard = (
-                previous_bitboard_piece & previous_bitboard_color
-            ) & ~(new_bitboard_piece & new_bitboard_color)
-            if removals:
-                for square in chess.scan_forward(removals):
-                    board_modifications.add_removal(
-                        PieceInSquare(square=square, piece=piece_type, color=color)
-                    )
-
-            appearance: chess.Bitboard = ~(
-                previous_bitboard_piece & previous_bitboard_color
-            ) & (new_bitboard_piece & new_bitboard_color)
-
-            if appearance:
-                for square in chess.scan_forward(appearance):
-                    board_modifications.add_appearance(
-                        PieceInSquare(square=square, piece=piece_type, color=color)
-                    )
+    removals, appearances = _diff_kernel(
+        (
+            previous_pawns,
+            previous_knights,
+            previous_bishops,
+            previous_rooks,
+            previous_queens,
+            previous_kings,
+            previous_occupied_black,
+            previous_occupied_white,
+        ),
+        (
+            new_pawns,
+            new_knights,
+            new_bishops,
+            new_rooks,
+            new_queens,
+            new_kings,
+            new_occupied_black,
+            new_occupied_white,
+        ),
+    )
+
+    return BoardModification(removals_=removals, appearances_=appearances)
+
 
+def compute_modifications_batch(
+    previous_snapshots: Sequence[BitboardSnapshot],
+    new_snapshots: Sequence[BitboardSnapshot],
+) -> list[BoardModification]:
+    """Compute the board modifications for many pairs of board states at once.
+
+    This is meant for callers expanding many positions at a time: the snapshots are
+    fed straight to the diff kernel without going through the keyword arguments of
+    compute_modifications.
+
+    Args:
+        previous_snapshots: The bitboards of the previous board states.
+        new_snapshots: The bitboards of the new board states, in the same order.
+
+    Returns:
+        list[BoardModification]: The board modifications, one per pair of states.
+
+    """
+    board_modifications: list[BoardModification] = []
+    for previous, new in zip(previous_snapshots, new_snapshots, strict=True):
+        removals, appearances = _diff_kernel(previous, new)
+        board_modifications.append(
+            BoardModification(removals_=removals, appearances_=appearances)
+        )
     return board_modifications
+
+
+@dataclass(frozen=True)
+class PackedBoardModifications:
+    """The board modifications of many moves packed into flat arrays.
+
+    Each entry of removals and appearances is a 16-bit unsigned int in the form of
+    encode_piece_in_square. The changes of the i-th move are
+    removals[removal_offsets[i]:removal_offsets[i + 1]] (and likewise for the
+    appearances). The arrays expose the buffer protocol, so array libraries can read
+    them without copying, e.g. numpy.frombuffer(packed.removals, dtype=numpy.uint16).
+    """
+
+    removals: array[int]
+    appearances: array[int]
+    removal_offsets: array[int]
+    appearance_offsets: array[int]
+
+
+def pack_board_modifications(
+    board_modifications: Iterable[BoardModification],
+) -> PackedBoardModifications:
+    """Pack the board modifications of many moves into flat arrays.
+
+    Args:
+        board_modifications: The board modifications to pack, in order.
+
+    Returns:
+        PackedBoardModifications: The packed board modifications.
+
+    """
+    removals: array[int] = array("H")
+    appearances: array[int] = array("H")
+    removal_offsets: array[int] = array("I", [0])
+    appearance_offsets: array[int] = array("I", [0])
+    for board_modification in board_modifications:
+        removals.extend(board_modification.removals_)
+        appearances.extend(board_modification.appearances_)
+        removal_offsets.append(len(removals))
+        appearance_offsets.append(len(appearances))
+    return PackedBoardModifications(
+        removals=removals,
+        appearances=appearances,
+        removal_offsets=removal_offsets,
+        appearance_offsets=appearance_offsets,
+    )
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import Counter
 from functools import partial
 from importlib.util import find_spec
 from typing import TYPE_CHECKING, Protocol
@@ -10,13 +9,14 @@ from typing import TYPE_CHECKING, Protocol
 import chess
 
 from .board_chi import BoardChi, LegalMoveKeyGenerator
-from .iboard import BoardKey, IBoard, compute_key
+from .iboard import BOARD_KEY_STRUCT
 
 _HAS_SHAKMATY_BINDING = find_spec("shakmaty_python_binding") is not None
 
 if TYPE_CHECKING:
     import shakmaty_python_binding  # only for type annotations
 
+    from .iboard import BoardKey, IBoard
     from .rusty_board import LegalMoveKeyGeneratorRust, RustyBoardChi
     from .utils import Fen, FenPlusHistory
 
@@ -93,23 +93,6 @@ def create_board_chi_from_pychess_board(
         BoardChi: The created chess board.
 
     """
-    board_key_representation: BoardKey = compute_key(
-        pawns=chess_board.pawns,
-        knights=chess_board.knights,
-        bishops=chess_board.bishops,
-        rooks=chess_board.rooks,
-        queens=chess_board.queens,
-        kings=chess_board.kings,
-        turn=chess_board.turn,
-        castling_rights=chess_board.castling_rights,
-        ep_square=chess_board.ep_square,
-        white=chess_board.occupied_co[chess.WHITE],
-        black=chess_board.occupied_co[chess.BLACK],
-        promoted=chess_board.promoted,
-        fullmove_number=chess_board.fullmove_number,
-        halfmove_clock=chess_board.halfmove_clock,
-    )
-
     legal_moves: LegalMoveKeyGenerator = LegalMoveKeyGenerator(
         chess_board=chess_board, sort_legal_moves=sort_legal_moves
     )
@@ -117,7 +100,7 @@ def create_board_chi_from_pychess_board(
     board: BoardChi = BoardChi(
         chess_board=chess_board,
         compute_board_modification=use_board_modification,
-        fast_representation_=board_key_representation,
+        fast_representation_=None,  # built from the board when first needed
         legal_moves_=legal_moves,
     )
     return board
@@ -148,7 +131,7 @@ def create_board_chi(
         chess_board.move_stack = [
             chess.Move.from_uci(move) for move in fen_with_history.historical_moves
         ]
-        chess_board._stack = fen_with_history.historical_boards  # pyright: ignore[reportPrivateUsage] #pylint: disable=protected-access
+        chess_board._stack = list(fen_with_history.historical_boards)  # pyright: ignore[reportPrivateUsage] #pylint: disable=protected-access
 
     else:
         chess_board = chess.Board()
@@ -214,23 +197,26 @@ def create_rust_board(
     promoted: int = chess_rust_binding.promoted()
     castling_rights: int = chess_rust_binding.castling_rights()
 
+    fullmove_number: int = chess_rust_binding.fullmove_number()
+    halfmove_clock: int = chess_rust_binding.halfmove_clock()
+
     ep_square = None if ep_square_int == -1 else ep_square_int
 
-    board_key_representation: BoardKey = compute_key(
-        pawns=pawns,
-        knights=knights,
-        bishops=bishops,
-        rooks=rooks,
-        queens=queens,
-        kings=kings,
-        turn=turn,
-        castling_rights=castling_rights,
-        ep_square=ep_square,
-        white=white,
-        black=black,
-        promoted=promoted,
-        fullmove_number=chess_rust_binding.fullmove_number(),
-        halfmove_clock=chess_rust_binding.halfmove_clock(),
+    board_key_representation: BoardKey = BOARD_KEY_STRUCT.pack(
+        pawns,
+        knights,
+        bishops,
+        rooks,
+        queens,
+        kings,
+        turn,
+        castling_rights,
+        ep_square_int,
+        white,
+        black,
+        promoted,
+        fullmove_number,
+        halfmove_clock,
     )
 
     legal_moves: LegalMoveKeyGeneratorRust = LegalMoveKeyGeneratorRust(
@@ -242,7 +228,7 @@ def create_rust_board(
     rusty_board_chi: RustyBoardChi = RustyBoardChi(
         chess_=chess_rust_binding,
         compute_board_modification=use_board_modification,
-        rep_to_count=Counter(),
+        rep_to_count={},
         fast_representation_=board_key_representation,
         pawns_=pawns,
         knights_=knights,
@@ -256,10 +242,12 @@ def create_rust_board(
         ep_square_=ep_square,
         castling_rights_=castling_rights,
         promoted_=promoted,
+        halfmove_clock_=halfmove_clock,
+        fullmove_number_=fullmove_number,
         legal_moves_=legal_moves,
     )
 
     if fen_with_history is not None:
-        rusty_board_chi.move_stack = fen_with_history.historical_moves
+        rusty_board_chi.move_stack = list(fen_with_history.historical_moves)
 
     return rusty_board_chi
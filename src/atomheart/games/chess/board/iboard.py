@@ -1,8 +1,8 @@
 """Interface for a chess board."""
 
+import struct
 import typing
 from collections.abc import Iterator, Sequence
-from dataclasses import asdict
 from typing import Any, Protocol, Self
 
 import chess
@@ -13,17 +13,26 @@ from atomheart.games.chess.move.imove import MoveKey
 from atomheart.games.chess.move.utils import MoveUci
 
 from .board_modification import BoardModificationP
-from .utils import Fen, FenPlusHistory, FenPlusMoveHistory
-
-# identifier that should be unique to any position
-BoardKey = tuple[
-    int, int, int, int, int, int, bool, int, int | None, int, int, int, int, int
-]
+from .utils import Fen, FenPlusHistory
+
+# the C dumper of libyaml is much faster than the pure Python one when it is available
+_Dumper: type[yaml.CSafeDumper | yaml.SafeDumper]
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+# identifier that should be unique to any position, it is packed with BOARD_KEY_STRUCT from
+# (pawns, knights, bishops, rooks, queens, kings, turn, castling_rights, ep_square (-1 if
+# none), white, black, promoted, fullmove_number, halfmove_clock) where the board state
+# changes. Bytes are hashed and compared in C and cache their hash, unlike tuples.
+BoardKey = bytes
+BOARD_KEY_STRUCT: struct.Struct = struct.Struct("<6Q?QbQQQII")
 
 # identifier that removes the info (such as rounds) to count easily repeating position at difference round of the game
-BoardKeyWithoutCounters = tuple[
-    int, int, int, int, int, int, bool, int, int | None, int, int, int
-]
+BoardKeyWithoutCounters = bytes
+# the two counters are packed at the end of the key
+BOARD_KEY_WITHOUT_COUNTERS_SIZE: int = BOARD_KEY_STRUCT.size - struct.calcsize("<II")
 
 
 class BoardInvariantError(RuntimeError):
@@ -80,6 +89,21 @@ class LegalMoveKeyGeneratorP(valanga.BranchKeyGeneratorP[MoveKey], Protocol):
         """
         ...
 
+    def get_move_key_from_uci(self, move_uci: MoveUci) -> MoveKey:
+        """Return the move key corresponding to the given UCI string.
+
+        Args:
+            move_uci (MoveUci): The UCI string to convert to a move key.
+
+        Returns:
+            MoveKey: The move key corresponding to the given UCI string.
+
+        Raises:
+            BoardInvariantError: If the UCI string is not found in the legal moves.
+
+        """
+        ...
+
     def copy_with_reset(self) -> Self:
         """Create a copy of the legal move generator with an optional reset of generated moves.
 
@@ -95,52 +119,6 @@ class LegalMoveKeyGeneratorP(valanga.BranchKeyGeneratorP[MoveKey], Protocol):
         ...
 
 
-def compute_key(
-    pawns: int,
-    knights: int,
-    bishops: int,
-    rooks: int,
-    queens: int,
-    kings: int,
-    turn: bool,
-    castling_rights: int,
-    ep_square: int | None,
-    white: int,
-    black: int,
-    promoted: int,
-    fullmove_number: int,
-    halfmove_clock: int,
-) -> BoardKey:
-    """Compute and return a unique key representing the current state of the chess board.
-
-    The key is computed by concatenating various attributes of the board, including the positions of pawns, knights,
-    bishops, rooks, queens, and kings, as well as the current turn, castling rights, en passant square, halfmove clock,
-    occupied squares for each color, promoted pieces, and the fullmove number.
-    It is faster than calling the fen.
-
-    Returns:
-        str: A unique key representing the current state of the chess board.
-
-    """
-    string: BoardKey = (
-        pawns,
-        knights,
-        bishops,
-        rooks,
-        queens,
-        kings,
-        turn,
-        castling_rights,
-        ep_square,
-        white,
-        black,
-        promoted,
-        fullmove_number,
-        halfmove_clock,
-    )
-    return string
-
-
 # Note that we do not use Dict[Square, Piece] because of the rust version that would need to transform
 # tuple[chess.PieceType, chess.Color] into Piece and would lose time
 PieceMap = typing.Annotated[
@@ -152,6 +130,9 @@ PieceMap = typing.Annotated[
 class IBoard(Protocol):
     """Interface for a chess board."""
 
+    # empty so that implementations declaring __slots__ get no instance dict
+    __slots__ = ()
+
     fast_representation_: BoardKey
 
     def get_uci_from_move_key(self, move_key: MoveKey) -> MoveUci:
@@ -176,17 +157,10 @@ class IBoard(Protocol):
             MoveKey: The move key corresponding to the given UCI string.
 
         Raises:
-                KeyError: If the UCI string is not found in the legal moves.
+            BoardInvariantError: If the UCI string is not found in the legal moves.
 
         """
-        number_moves: int = len(self.legal_moves.get_all())
-        i: int
-
-        for i in range(number_moves):
-            if self.legal_moves.get_uci_from_move_key(i) == move_uci:
-                return i
-
-        raise BoardInvariantError
+        return self.legal_moves.get_move_key_from_uci(move_uci)
 
     def play_move_key(self, move: MoveKey) -> BoardModificationP | None:
         """Plays the move corresponding to the given move key.
@@ -358,14 +332,14 @@ class IBoard(Protocol):
             file (Any): The file object to write the board state to.
 
         """
-        # create minimal info for reconstruction that is the class FenPlusMoveHistory
-
-        current_fen: Fen = self.fen
-        fen_plus_moves: FenPlusMoveHistory = FenPlusMoveHistory(
-            current_fen=current_fen, historical_moves=self.move_history_stack
-        )
+        # create minimal info for reconstruction, that is the fields of FenPlusMoveHistory,
+        # directly as a dict as asdict would deep copy the move history
+        fen_plus_moves: dict[str, Any] = {
+            "current_fen": self.fen,
+            "historical_moves": list(self.move_history_stack),
+        }
 
-        yaml.dump(asdict(fen_plus_moves), file, default_flow_style=False)
+        yaml.dump(fen_plus_moves, file, Dumper=_Dumper, default_flow_style=False)
 
     @property
     def ep_square(self) -> int | None:
@@ -395,7 +369,7 @@ class IBoard(Protocol):
         :rtype: str
         """
         assert self.fast_representation_ is not None
-        return self.fast_representation_[:-2]
+        return self.fast_representation_[:BOARD_KEY_WITHOUT_COUNTERS_SIZE]
 
     def is_zeroing(self, move: MoveKey) -> bool:
         """Check if a move is a zeroing move (i.e., checks if the given move is a capture or pawn move.
@@ -3,31 +3,43 @@
 Defines a Rust-based chess board implementation using shakmaty_python_binding.
 """
 
-from collections import Counter
 from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
-from typing import Any, Self, no_type_check
+from typing import Any, Self, cast
 
 import chess
 import shakmaty_python_binding
 from valanga import Color
 
 from atomheart.games.chess.move.imove import MoveKey
-from atomheart.games.chess.move.utils import MoveUci
+from atomheart.games.chess.move.utils import MoveUci, intern_uci
 
 from .board_modification import (
     BoardModificationP,
     BoardModificationRust,
 )
 from .iboard import (
+    BOARD_KEY_STRUCT,
+    BOARD_KEY_WITHOUT_COUNTERS_SIZE,
+    BoardInvariantError,
     BoardKey,
     BoardKeyWithoutCounters,
     IBoard,
     LegalMoveKeyGeneratorP,
-    compute_key,
 )
 from .utils import Fen, FenPlusHistory
 
+# the unsorted move keys of a position with n legal moves are _IDENTITY_KEYS[n], shared by
+# all generators and handed to callers, so they are tuples (there are at most 218 legal
+# moves in a chess position)
+_IDENTITY_KEYS: tuple[tuple[MoveKey, ...], ...] = tuple(
+    tuple(range(n)) for n in range(256)
+)
+
+
+# en passant square from the int given by the binding, where -1 (the last index) means none
+_EP_SQUARES: tuple[int | None, ...] = (*range(64), None)
+
 
 class LegalMoveKeyGeneratorRust(LegalMoveKeyGeneratorP):
     """LegalMoveKeyGeneratorRust is a Rust-compatible implementation of the LegalMoveKeyGeneratorP interface."""
@@ -35,7 +47,15 @@ class LegalMoveKeyGeneratorRust(LegalMoveKeyGeneratorP):
     # whether to sort the legal_moves by their respective uci for easy comparison of various implementations
     sort_legal_moves: bool
 
-    all_generated_keys_: list[MoveKey] | None
+    # generated_moves is never modified in place once assigned (it is only rebound) and
+    # all_generated_keys_ is a tuple, so copies of the generator share them
+    all_generated_keys_: tuple[MoveKey, ...] | None
+
+    # reverse of get_uci_from_move_key, built on the first lookup
+    uci_to_key_: dict[MoveUci, MoveKey] | None
+
+    # uci of each generated move, filled on demand as each call to uci() crosses into Rust
+    ucis_: list[MoveUci | None] | None
 
     chess_rust_binding: shakmaty_python_binding.MyChess
 
@@ -54,9 +74,41 @@ class LegalMoveKeyGeneratorRust(LegalMoveKeyGeneratorP):
             moveUci: The UCI string corresponding to the given move key.
 
         """
-        assert self.generated_moves is not None
-        chess_move: shakmaty_python_binding.MyMove = self.generated_moves[move_key]
-        return chess_move.uci()
+        return self._uci(move_key)
+
+    def _uci(self, move_key: MoveKey) -> MoveUci:
+        ucis = self.ucis_
+        if ucis is None:
+            assert self.generated_moves is not None
+            ucis = self.ucis_ = [None] * len(self.generated_moves)
+        move_uci = ucis[move_key]
+        if move_uci is None:
+            assert self.generated_moves is not None
+            move_uci = ucis[move_key] = intern_uci(self.generated_moves[move_key].uci())
+        return move_uci
+
+    def get_move_key_from_uci(self, move_uci: MoveUci) -> MoveKey:
+        """Return the move key corresponding to the given UCI string.
+
+        Args:
+            move_uci (MoveUci): The UCI string to convert to a move key.
+
+        Returns:
+            MoveKey: The move key corresponding to the given UCI string.
+
+        Raises:
+            BoardInvariantError: If the UCI string is not found in the legal moves.
+
+        """
+        if self.uci_to_key_ is None:
+            self.get_all()  # makes sure the moves are generated
+            self.uci_to_key_ = {
+                self._uci(move_key): move_key for move_key in range(self.number_moves)
+            }
+        try:
+            return self.uci_to_key_[move_uci]
+        except KeyError:
+            raise BoardInvariantError from None
 
     def __init__(
         self,
@@ -74,24 +126,13 @@ class LegalMoveKeyGeneratorRust(LegalMoveKeyGeneratorP):
         """
         self.chess_rust_binding = chess_rust_binding
         self.generated_moves = generated_moves
+        self.uci_to_key_ = None
+        self.ucis_ = None
+        # the (possibly sorted) keys are computed once, when they are first needed
+        self.all_generated_keys_ = None
         if generated_moves is not None:
             self.number_moves = len(generated_moves)
             self.it: Iterator[int] = iter(range(self.number_moves))
-            self.all_generated_keys_ = list(range(self.number_moves))
-            if sort_legal_moves:
-
-                def f(i: int) -> MoveUci:
-                    assert self.generated_moves is not None
-                    return self.generated_moves[i].uci()
-
-                self.all_generated_keys_ = sorted(
-                    list(range(self.number_moves)),
-                    key=f,
-                )
-            else:
-                self.all_generated_keys_ = list(range(self.number_moves))
-        else:
-            self.all_generated_keys_ = None
         self.sort_legal_moves = sort_legal_moves
 
     @property
@@ -104,15 +145,22 @@ class LegalMoveKeyGeneratorRust(LegalMoveKeyGeneratorP):
         self.generated_moves = generated_moves
         self.number_moves = len(generated_moves)
         self.it = iter(range(self.number_moves))
-        self.all_generated_keys_ = list(range(self.number_moves))
+        self.all_generated_keys_ = None
+        self.uci_to_key_ = None
+        self.ucis_ = None
 
     def copy_with_reset(self) -> "LegalMoveKeyGeneratorRust":
         """Create a copy of the legal move generator with reset state."""
-        return LegalMoveKeyGeneratorRust(
-            chess_rust_binding=self.chess_rust_binding,
-            generated_moves=None,
-            sort_legal_moves=self.sort_legal_moves,
-        )
+        # called on every move: the fields are set directly rather than going through
+        # __init__ and its keyword arguments, which halves the cost of the copy
+        legal_move_copy = LegalMoveKeyGeneratorRust.__new__(LegalMoveKeyGeneratorRust)
+        legal_move_copy.chess_rust_binding = self.chess_rust_binding
+        legal_move_copy.sort_legal_moves = self.sort_legal_moves
+        legal_move_copy.generated_moves = None
+        legal_move_copy.all_generated_keys_ = None
+        legal_move_copy.uci_to_key_ = None
+        legal_move_copy.ucis_ = None
+        return legal_move_copy
 
     def set_legal_moves(
         self, generated_moves: list[shakmaty_python_binding.MyMove]
@@ -120,26 +168,39 @@ class LegalMoveKeyGeneratorRust(LegalMoveKeyGeneratorP):
         """Set the legal moves for the generator."""
         self.generated_moves = generated_moves
         self.number_moves = len(generated_moves)
+        self.all_generated_keys_ = None
+        self.uci_to_key_ = None
+        self.ucis_ = None
+
+    def _ensure_sorted_keys(self) -> Sequence[MoveKey]:
+        """Return the move keys in iteration order, generating and sorting them at most once."""
+        if self.all_generated_keys_ is None:
+            if self.generated_moves is None:
+                self.generated_moves = self.chess_rust_binding.legal_moves()
+                self.number_moves = len(self.generated_moves)
+            if self.sort_legal_moves and self.ucis_ is None:
+                # every uci is needed to sort: read them all in one pass and sort on
+                # plain list indexing rather than going through _uci for each key
+                all_ucis = [
+                    intern_uci(chess_move.uci()) for chess_move in self.generated_moves
+                ]
+                self.ucis_ = cast("list[MoveUci | None]", all_ucis)
+                self.all_generated_keys_ = tuple(
+                    sorted(range(self.number_moves), key=all_ucis.__getitem__)
+                )
+            elif self.sort_legal_moves:
+                self.all_generated_keys_ = tuple(
+                    sorted(range(self.number_moves), key=self._uci)
+                )
+            elif self.number_moves < len(_IDENTITY_KEYS):
+                self.all_generated_keys_ = _IDENTITY_KEYS[self.number_moves]
+            else:
+                self.all_generated_keys_ = tuple(range(self.number_moves))
+        return self.all_generated_keys_
 
     def __iter__(self) -> Iterator[MoveKey]:
         """Return an iterator over the legal move keys."""
-        if self.generated_moves is None:
-            self.generated_moves = self.chess_rust_binding.legal_moves()
-        if self.sort_legal_moves:
-            assert self.generated_moves is not None
-
-            def f(i: int) -> MoveUci:
-                assert self.generated_moves is not None
-                return self.generated_moves[i].uci()
-
-            self.it = iter(
-                sorted(
-                    list(range(self.number_moves)),
-                    key=f,
-                )
-            )
-        else:
-            self.it = iter(range(self.number_moves))
+        self.it = iter(self._ensure_sorted_keys())
         return self
 
     def __next__(self) -> MoveKey:
@@ -164,17 +225,13 @@ class LegalMoveKeyGeneratorRust(LegalMoveKeyGeneratorP):
             copied_chess_rust_binding_ = copied_chess_rust_binding
         legal_move_copy = LegalMoveKeyGeneratorRust(
             chess_rust_binding=copied_chess_rust_binding_,
-            generated_moves=(
-                self.generated_moves.copy()
-                if self.generated_moves is not None
-                else None
-            ),
+            generated_moves=self.generated_moves,
             sort_legal_moves=self.sort_legal_moves,
         )
-        if self.all_generated_keys_ is not None:
-            legal_move_copy.all_generated_keys_ = self.all_generated_keys_.copy()
-        else:
-            legal_move_copy.all_generated_keys_ = legal_move_copy.all_generated_keys_
+        # same moves, so the keys and the uci caches are shared as well
+        legal_move_copy.all_generated_keys_ = self.all_generated_keys_
+        legal_move_copy.ucis_ = self.ucis_
+        legal_move_copy.uci_to_key_ = self.uci_to_key_
         return legal_move_copy
 
     def get_all(self) -> Sequence[MoveKey]:
@@ -184,24 +241,7 @@ class LegalMoveKeyGeneratorRust(LegalMoveKeyGeneratorP):
             Sequence[MoveKey]: A sequence of all legal move keys.
 
         """
-        if self.generated_moves is None:
-            self.generated_moves = self.chess_rust_binding.legal_moves()
-            self.number_moves = len(self.generated_moves)
-            self.all_generated_keys_ = None
-
-        if self.all_generated_keys_ is None:
-            if self.sort_legal_moves:
-
-                def f(i: int) -> MoveUci:
-                    assert self.generated_moves is not None
-                    return self.generated_moves[i].uci()
-
-                return sorted(
-                    list(range(self.number_moves)),
-                    key=f,
-                )
-            return list(range(self.number_moves))
-        return self.all_generated_keys_
+        return self._ensure_sorted_keys()
 
     def more_than_one(self) -> bool:
         """Check if there is more than one legal move available."""
@@ -215,11 +255,36 @@ class LegalMoveKeyGeneratorRust(LegalMoveKeyGeneratorP):
 # TODO(victor): implement rewind (and a test for it). See issue #24 for more details.
 
 
-def _move_stack_factory() -> list[MoveUci]:
+def _move_stack_factory() -> list[MoveUci | shakmaty_python_binding.MyMove]:
     return []
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class RustyBoardUndo:
+    """State of a RustyBoardChi before a move, as recorded by RustyBoardChi.make_move."""
+
+    # a copy of the rust position before the move, as the binding cannot undo a move
+    chess_: shakmaty_python_binding.MyChess
+    legal_moves_: LegalMoveKeyGeneratorRust
+    fast_representation_: BoardKey
+    max_rep_: int
+    pawns_: int
+    kings_: int
+    queens_: int
+    rooks_: int
+    bishops_: int
+    knights_: int
+    white_: int
+    black_: int
+    turn_: bool
+    ep_square_: int | None
+    promoted_: int
+    castling_rights_: int
+    halfmove_clock_: int
+    fullmove_number_: int
+
+
+@dataclass(slots=True)
 class RustyBoardChi(IBoard):
     """Rusty Board Chipiron.
 
@@ -237,7 +302,7 @@ class RustyBoardChi(IBoard):
 
     # to count the number of occurrence of each board to be able to compute
     # three-fold repetition as shakmaty does not do it atm
-    rep_to_count: Counter[BoardKeyWithoutCounters]
+    rep_to_count: dict[BoardKeyWithoutCounters, int]
 
     fast_representation_: BoardKey
 
@@ -254,15 +319,34 @@ class RustyBoardChi(IBoard):
     ep_square_: int | None
     promoted_: int
     castling_rights_: int
+    # counters followed in python as well, to build the key without calling the binding
+    halfmove_clock_: int
+    fullmove_number_: int
 
     legal_moves_: LegalMoveKeyGeneratorRust
 
     # the move history is kept here because shakmaty_python_binding.MyChess does not have a move stack at the moment
-    move_stack: list[MoveUci] = field(default_factory=_move_stack_factory)
+    # the moves played are stored as given and only converted to uci (a call to the binding)
+    # when the history is asked for, as search never reads it
+    move_stack: list[MoveUci | shakmaty_python_binding.MyMove] = field(
+        default_factory=_move_stack_factory
+    )
+
+    # highest count in rep_to_count, kept up to date on each move so that checking for
+    # three-fold repetition does not scan the counter (0 to compute it from rep_to_count)
+    max_rep_: int = 0
+
+    # fen of the current position, built by the binding the first time it is asked for
+    fen_: Fen | None = None
+
+    # answer of the binding to is_game_over for the current position, once asked
+    is_game_over_: bool | None = None
 
     def __post_init__(self) -> None:
         """Initialize repetition counters after dataclass creation."""
         self.rep_to_count.setdefault(self.fast_representation_without_counters, 1)
+        if not self.max_rep_:
+            self.max_rep_ = max(self.rep_to_count.values())
 
     def __str__(self) -> str:
         """Return a string representation of the board.
@@ -273,8 +357,34 @@ class RustyBoardChi(IBoard):
         """
         return self.fen
 
-    def play_min_2(self, move: shakmaty_python_binding.MyMove) -> None:
-        """Plays a move on the board without returning any modifications."""
+    def play_move(
+        self, move: shakmaty_python_binding.MyMove
+    ) -> BoardModificationP | None:
+        """Plays a move on the board and returns the board modification.
+
+        Args:
+            move: The move to play.
+
+        Returns:
+            The board modification resulting from the move or None.
+
+        """
+        # TODO(victor): illegal moves seem accepted, do we care? if we dont write it in the doc. See issue #24 for more details.
+        board_modifications: BoardModificationRust | None = None
+
+        self.halfmove_clock_ = 0 if move.is_zeroing() else self.halfmove_clock_ + 1
+        if not self.turn_:  # black is moving
+            self.fullmove_number_ += 1
+
+        if self.compute_board_modification:
+            bitboards, appearances, removals = (
+                self.chess_.play_and_return_modifications(move)
+            )
+            board_modifications = BoardModificationRust(
+                appearances_=appearances, removals_=removals
+            )
+        else:
+            bitboards = self.chess_.play_and_return_o(move)
         (
             self.castling_rights_,
             self.pawns_,
@@ -288,109 +398,119 @@ class RustyBoardChi(IBoard):
             turn_int,
             ep_square_int,
             self.promoted_,
-        ) = self.chess_.play_and_return_o(move)
+        ) = bitboards
         self.turn_ = bool(turn_int)
-        if ep_square_int == -1:
-            self.ep_square_ = None
-        else:
-            self.ep_square_ = ep_square_int
+        self.ep_square_ = _EP_SQUARES[ep_square_int]
 
-    def play_min_3(self, move: shakmaty_python_binding.MyMove) -> BoardModificationRust:
-        """Plays a move on the board and returns the board modifications."""
-        (
-            (
-                self.castling_rights_,
-                self.pawns_,
-                self.knights_,
-                self.bishops_,
-                self.rooks_,
-                self.queens_,
-                self.kings_,
-                self.white_,
-                self.black_,
-                turn_int,
-                ep_square_int,
-                self.promoted_,
-            ),
-            appearances,
-            removals,
-        ) = self.chess_.play_and_return_modifications(move)
-        self.turn_ = bool(turn_int)
-        if ep_square_int == -1:
-            self.ep_square_ = None
-        else:
-            self.ep_square_ = ep_square_int
-
-        board_modifications: BoardModificationRust = self.convert(appearances, removals)
-        return board_modifications
-
-    def convert(
-        self,
-        appearances: set[tuple[int, int, int]],
-        removals: set[tuple[int, int, int]],
-    ) -> BoardModificationRust:
-        """Convert appearances and removals into a BoardModificationRust object.
-
-        Args:
-            appearances (set[tuple[int, int, int]]): The set of appearances.
-            removals (set[tuple[int, int, int]]): The set of removals.
-
-        Returns:
-            BoardModificationRust: The board modification object.
+        # update after move
+        self.legal_moves_ = (
+            self.legal_moves_.copy_with_reset()
+        )  # the legals moves needs to be recomputed as the board has changed
+        self.fen_ = None
+        self.is_game_over_ = None
 
-        """
-        board_modifications: BoardModificationRust = BoardModificationRust(
-            appearances_=appearances, removals_=removals
+        ep_square = self.ep_square_
+        fast_representation = BOARD_KEY_STRUCT.pack(
+            self.pawns_,
+            self.knights_,
+            self.bishops_,
+            self.rooks_,
+            self.queens_,
+            self.kings_,
+            self.turn_,
+            self.castling_rights_,
+            -1 if ep_square is None else ep_square,
+            self.white_,
+            self.black_,
+            self.promoted_,
+            self.fullmove_number_,
+            self.halfmove_clock_,
         )
+        self.fast_representation_ = fast_representation
+
+        key_without_counters = fast_representation[:BOARD_KEY_WITHOUT_COUNTERS_SIZE]
+        count = self.rep_to_count.get(key_without_counters, 0) + 1
+        self.rep_to_count[key_without_counters] = count
+        self.max_rep_ = max(self.max_rep_, count)
+        self.move_stack.append(move)
 
         return board_modifications
 
-    def play_move(
+    def make_move(
         self, move: shakmaty_python_binding.MyMove
-    ) -> BoardModificationP | None:
-        """Plays a move on the board and returns the board modification.
+    ) -> tuple[RustyBoardUndo, BoardModificationP | None]:
+        """Play a move in place, recording what is needed to take it back with unmake_move.
+
+        This is meant for search, where copying the whole board before trying each move
+        is the main cost: only the rust position is copied, while the move stack and the
+        repetition counts are updated in place.
 
         Args:
             move: The move to play.
 
         Returns:
-            The board modification resulting from the move or None.
+            The record to give to unmake_move and the board modification resulting from
+            the move or None.
 
         """
-        # TODO(victor): illegal moves seem accepted, do we care? if we dont write it in the doc. See issue #24 for more details.
-        board_modifications: BoardModificationRust | None = None
+        undo = RustyBoardUndo(
+            chess_=self.chess_.copy(),
+            legal_moves_=self.legal_moves_,
+            fast_representation_=self.fast_representation_,
+            max_rep_=self.max_rep_,
+            pawns_=self.pawns_,
+            kings_=self.kings_,
+            queens_=self.queens_,
+            rooks_=self.rooks_,
+            bishops_=self.bishops_,
+            knights_=self.knights_,
+            white_=self.white_,
+            black_=self.black_,
+            turn_=self.turn_,
+            ep_square_=self.ep_square_,
+            promoted_=self.promoted_,
+            castling_rights_=self.castling_rights_,
+            halfmove_clock_=self.halfmove_clock_,
+            fullmove_number_=self.fullmove_number_,
+        )
+        return undo, self.play_move(move)
 
-        if self.compute_board_modification:
-            board_modifications = self.play_min_3(move)
-        else:
-            self.play_min_2(move)
+    def unmake_move(self, undo: RustyBoardUndo) -> None:
+        """Take back the last move played with make_move.
 
-        # update after move
-        self.legal_moves_ = (
-            self.legal_moves_.copy_with_reset()
-        )  # the legals moves needs to be recomputed as the board has changed
-
-        fast_representation: BoardKey = compute_key(
-            pawns=self.pawns_,
-            knights=self.knights_,
-            bishops=self.bishops_,
-            rooks=self.rooks_,
-            queens=self.queens_,
-            kings=self.kings_,
-            turn=self.turn_,
-            castling_rights=self.castling_rights_,
-            ep_square=self.ep_square_,
-            white=self.white_,
-            black=self.black_,
-            promoted=self.promoted_,
-            fullmove_number=self.chess_.fullmove_number(),
-            halfmove_clock=self.chess_.halfmove_clock(),
-        )
-        self.fast_representation_ = fast_representation
-        self.rep_to_count.update([self.fast_representation_without_counters])
-        self.move_stack.append(move.uci())
+        Args:
+            undo: The record returned by make_move for that move.
 
-        return board_modifications
+        """
+        key_without_counters = self.fast_representation_without_counters
+        count = self.rep_to_count[key_without_counters] - 1
+        if count:
+            self.rep_to_count[key_without_counters] = count
+        else:
+            del self.rep_to_count[key_without_counters]
+        self.move_stack.pop()
+
+        self.chess_ = undo.chess_
+        self.fen_ = None
+        self.is_game_over_ = None
+        self.legal_moves_ = undo.legal_moves_
+        self.legal_moves_.chess_rust_binding = undo.chess_
+        self.fast_representation_ = undo.fast_representation_
+        self.max_rep_ = undo.max_rep_
+        self.pawns_ = undo.pawns_
+        self.kings_ = undo.kings_
+        self.queens_ = undo.queens_
+        self.rooks_ = undo.rooks_
+        self.bishops_ = undo.bishops_
+        self.knights_ = undo.knights_
+        self.white_ = undo.white_
+        self.black_ = undo.black_
+        self.turn_ = undo.turn_
+        self.ep_square_ = undo.ep_square_
+        self.promoted_ = undo.promoted_
+        self.castling_rights_ = undo.castling_rights_
+        self.halfmove_clock_ = undo.halfmove_clock_
+        self.fullmove_number_ = undo.fullmove_number_
 
     def play_move_uci(self, move_uci: MoveUci) -> BoardModificationP | None:
         """Play a move in UCI format."""
@@ -427,7 +547,6 @@ class RustyBoardChi(IBoard):
         """
         return Color(int(self.turn_))
 
-    @no_type_check
     def is_game_over(self) -> bool:
         """Check if the game is over.
 
@@ -435,23 +554,31 @@ class RustyBoardChi(IBoard):
             bool: True if the game is over, False otherwise.
 
         """
-        claim_draw: bool = len(self.move_stack) >= 5
-        three_fold_repetition: bool = (
-            max(self.rep_to_count.values()) > 2 if claim_draw else False
-        )
         # TODO(victor): check the move stack : check for repetition as the rust version not do it. See issue #24 for more details. This is a temporary solution to avoid the cost of calling the rust binding for is_game_over when we can compute it in python with the move stack and the rep_to_count.
-        # TODO(victor): remove this hasatrribute at some point. See issue #24 for more details. This is a temporary solution to avoid the cost of calling the rust binding for is_game_over when we can compute it in python with the move stack and the rep_to_count.
+        claim_draw: bool = len(self.move_stack) >= 5
+        if claim_draw and self.max_rep_ > 2:
+            # three-fold repetition, no need to ask the binding
+            return True
 
-        chess_game_over: bool = False
+        if self.is_game_over_ is None:
+            self.is_game_over_ = bool(self.chess_.is_game_over())
+        return self.is_game_over_
 
-        if hasattr(self, "is_game_over_"):
-            attr_value: Any = self.is_game_over_
-            chess_game_over = bool(attr_value)
-        else:
-            engine_result: Any = self.chess_.is_game_over()
-            chess_game_over = bool(engine_result)
+    def maybe_terminal(self) -> bool:
+        """Check if the game is known to be over without calling the binding.
+
+        This is meant to be checked before generating the legal moves of a position:
+        it is True on a three-fold repetition or when is_game_over already found the
+        game over. False does not mean the game goes on, only that is_game_over has
+        to be asked.
+
+        Returns:
+            bool: True if the game is known to be over, False otherwise.
 
-        return three_fold_repetition or chess_game_over
+        """
+        return (len(self.move_stack) >= 5 and self.max_rep_ > 2) or bool(
+            self.is_game_over_
+        )
 
     def copy(self, stack: bool, deep_copy_legal_moves: bool = True) -> Self:
         """Create a copy of the current board.
@@ -481,6 +608,9 @@ class RustyBoardChi(IBoard):
             move_stack=move_stack_,
             compute_board_modification=self.compute_board_modification,
             rep_to_count=self.rep_to_count.copy(),
+            max_rep_=self.max_rep_,
+            fen_=self.fen_,
+            is_game_over_=self.is_game_over_,
             fast_representation_=self.fast_representation_,
             pawns_=self.pawns_,
             knights_=self.knights_,
@@ -494,6 +624,8 @@ class RustyBoardChi(IBoard):
             ep_square_=self.ep_square_,
             promoted_=self.promoted_,
             castling_rights_=self.castling_rights_,
+            halfmove_clock_=self.halfmove_clock_,
+            fullmove_number_=self.fullmove_number_,
             legal_moves_=legal_moves_copy,
         )
 
@@ -523,7 +655,9 @@ class RustyBoardChi(IBoard):
 
         :return: The FEN string representing the current state of the board.
         """
-        return self.chess_.fen()
+        if self.fen_ is None:
+            self.fen_ = self.chess_.fen()
+        return self.fen_
 
     def piece_at(self, square: chess.Square) -> chess.Piece | None:
         """Return the piece at the specified square on the chess board.
@@ -581,7 +715,7 @@ class RustyBoardChi(IBoard):
             None
 
         """
-        return str(self.chess_.fen())
+        return self.fen
 
     def tell_result(self) -> None:
         """Log the result for the current board state."""
@@ -589,7 +723,12 @@ class RustyBoardChi(IBoard):
     @property
     def move_history_stack(self) -> list[MoveUci]:
         """Return the history of moves made in the game."""
-        return self.move_stack
+        move_stack = self.move_stack
+        for index, move in enumerate(move_stack):
+            if not isinstance(move, str):
+                move_stack[index] = intern_uci(move.uci())
+        # a snapshot, as the moves played afterwards are appended to move_stack unconverted
+        return cast("list[MoveUci]", move_stack.copy())
 
     def dump(self, file: Any) -> None:
         """Dump the current state of the board to the specified file."""
@@ -654,9 +793,7 @@ class RustyBoardChi(IBoard):
     def result(self, claim_draw: bool = False) -> str:
         """Return the game result as a string."""
         claim_draw_: bool = len(self.move_stack) >= 5 and claim_draw
-        three_fold_repetition: bool = (
-            max(self.rep_to_count.values()) > 2 if claim_draw_ else False
-        )
+        three_fold_repetition: bool = self.max_rep_ > 2 if claim_draw_ else False
 
         if three_fold_repetition:
             return "1/2-1/2"
@@ -680,7 +817,7 @@ class RustyBoardChi(IBoard):
     @property
     def halfmove_clock(self) -> int:
         """Return the halfmove clock value."""
-        return self.chess_.halfmove_clock()
+        return self.halfmove_clock_
 
     @property
     def promoted(self) -> chess.Bitboard:
@@ -690,7 +827,7 @@ class RustyBoardChi(IBoard):
     @property
     def fullmove_number(self) -> int:
         """Return the fullmove number."""
-        return self.chess_.fullmove_number()
+        return self.fullmove_number_
 
     @property
     def ep_square(self) -> int | None:
@@ -716,5 +853,5 @@ class RustyBoardChi(IBoard):
     def into_fen_plus_history(self) -> FenPlusHistory:
         """Convert the current board state into a FenPlusHistory object."""
         return FenPlusHistory(
-            current_fen=self.fen, historical_moves=self.move_history_stack
+            current_fen=self.fen, historical_moves=tuple(self.move_history_stack)
         )
@@ -1,7 +1,11 @@
 """Utility functions and data structures for handling chess board states and FEN strings."""
 
+import re
 import typing
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import NamedTuple
 
 import chess
 
@@ -30,16 +34,89 @@ class InvalidFenTurnError(FenError):
         super().__init__(f"expected 'w' or 'b' for turn part of fen: {fen!r}")
 
 
-def _moves_factory() -> list[chess.Move]:
-    return []
+class InvalidFenBoardError(FenError):
+    """Raised when the board part of a FEN string contains an invalid character."""
+
+    def __init__(self, fen: str) -> None:
+        """Initialize the invalid board error with the offending FEN."""
+        super().__init__(f"invalid character in board part of fen: {fen!r}")
+
+
+class InvalidFenFieldsError(FenError):
+    """Raised when a FEN string does not have the six expected fields."""
+
+    def __init__(self, fen: str) -> None:
+        """Initialize the invalid fields error with the offending FEN."""
+        super().__init__(f"expected six space separated fields in fen: {fen!r}")
+
+
+# the six fields of a full fen, matched in one go by the C regex engine
+_FEN_FIELDS_RE: re.Pattern[str] = re.compile(
+    r"\s*(\S+)\s+([wb])\s+(\S+)\s+(\S+)\s+(\d+)\s+(\d+)\s*"
+)
+
+# turn part of a fen, possibly followed by the space before the next field
+_TURN_PARTS: dict[str, chess.Color] = {
+    "w": chess.WHITE,
+    "w ": chess.WHITE,
+    "b": chess.BLACK,
+    "b ": chess.BLACK,
+}
 
 
-def _uci_factory() -> list[MoveUci]:
-    return []
+# layer of each piece letter in fen_to_bitboards: white pawn to king, then black pawn to king
+_PIECE_LAYERS: dict[str, int] = {
+    letter: layer for layer, letter in enumerate("PNBRQKpnbrqk")
+}
 
+# square_rotate of each square, for loops that rotate many squares: indexing a local
+# reference to the table saves the function call
+ROTATED_SQUARES: tuple[chess.Square, ...] = tuple(
+    square ^ 0x3F for square in chess.SQUARES
+)
 
-def _board_states_factory() -> list[chess._BoardState]:  # pyright: ignore[reportPrivateUsage]
-    return []  # pyright: ignore[reportPrivateUsage]
+# each byte with its bits in reverse order, as a table for bytes.translate
+_REVERSED_BITS: bytes = bytes(int(f"{byte:08b}"[::-1], 2) for byte in range(256))
+
+
+class FenFields(NamedTuple):
+    """The six fields of a FEN string."""
+
+    board: str
+    turn: chess.Color
+    castling: str
+    ep_square: str
+    halfmove_clock: int
+    fullmove_number: int
+
+
+def parse_fen_fields(fen: Fen) -> FenFields:
+    """Split a full FEN into its six fields with a single regex match.
+
+    Args:
+        fen: The FEN to split. All six fields must be present.
+
+    Returns:
+        FenFields: The fields of the FEN, with the turn as a color and the counters as
+            ints. The board, castling and en passant fields are not checked further.
+
+    Raises:
+        InvalidFenFieldsError: If the FEN does not have six fields or if its turn or
+            counters are not valid.
+
+    """
+    fields = _FEN_FIELDS_RE.fullmatch(fen)
+    if fields is None:
+        raise InvalidFenFieldsError(fen)
+    board, turn, castling, ep_square, halfmove_clock, fullmove_number = fields.groups()
+    return FenFields(
+        board=board,
+        turn=turn == "w",
+        castling=castling,
+        ep_square=ep_square,
+        halfmove_clock=int(halfmove_clock),
+        fullmove_number=int(fullmove_number),
+    )
 
 
 @dataclass
@@ -47,7 +124,7 @@ class FenPlusMoves:
     """FenPlusMoves dataclass to hold a FEN string and subsequent moves."""
 
     original_fen: Fen
-    subsequent_moves: list[chess.Move] = field(default_factory=_moves_factory)
+    subsequent_moves: Sequence[chess.Move] = ()
 
 
 @dataclass
@@ -55,48 +132,83 @@ class FenPlusMoveHistory:
     """FenPlusMoveHistory dataclass to hold a FEN string and subsequent moves in UCI format."""
 
     current_fen: Fen
-    historical_moves: list[MoveUci] = field(default_factory=_uci_factory)
+    historical_moves: Sequence[MoveUci] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class FenPlusHistory:
     """FenPlusHistory dataclass to hold a FEN string.
 
-    This stores subsequent moves in UCI format and historical board states.
+    This stores subsequent moves in UCI format and historical board states. The
+    histories default to empty tuples, so that a fen without history costs no list.
     """
 
     current_fen: Fen
-    historical_moves: list[MoveUci] = field(default_factory=_uci_factory)
-    historical_boards: list[chess._BoardState] = field(  # pyright: ignore[reportPrivateUsage]
-        default_factory=_board_states_factory
-    )
+    historical_moves: Sequence[MoveUci] = ()
+    historical_boards: Sequence[chess._BoardState] = ()  # pyright: ignore[reportPrivateUsage]
 
     def current_turn(self) -> chess.Color:
         """Return the color of the player to move."""
-        # copy of some code in the chess python library that cannot be easily extracted or called directly
-        parts = self.current_fen.split()
-
-        # Board part.
-        try:
-            _ = parts.pop(0)
-        except IndexError:
-            raise EmptyFenError from None
-
-        # Turn.
-        try:
-            turn_part = parts.pop(0)
-        except IndexError:
-            turn = chess.WHITE
-        else:
-            if turn_part == "w":
-                turn = chess.WHITE
-            elif turn_part == "b":
-                turn = chess.BLACK
-            else:
-                raise InvalidFenTurnError(self.current_fen)
+        fen = self.current_fen
+        # usual case of a fen whose fields are separated by single spaces: look at the
+        # characters after the board part instead of splitting the whole fen
+        board_end = fen.find(" ")
+        if board_end > 0:
+            turn = _TURN_PARTS.get(fen[board_end + 1 : board_end + 3])
+            if turn is not None:
+                return turn
+
+        # other spacings, following the parsing of the chess python library: only the
+        # board and turn parts are needed, so the rest of the fen is not split
+        parts = fen.split(maxsplit=2)
+        if not parts:
+            raise EmptyFenError
+        if len(parts) == 1:
+            return chess.WHITE
+        turn = _TURN_PARTS.get(parts[1])
+        if turn is None:
+            raise InvalidFenTurnError(fen)
         return turn
 
 
+def fen_to_bitboards(fen: Fen) -> array[int]:
+    """Read the pieces of a FEN into one bitboard per piece type and color.
+
+    The board part is read in a single pass over its characters, without building a
+    board. The bitboards are in the order white pawns, knights, bishops, rooks, queens,
+    kings, then the same for black, with the squares numbered as in the chess library
+    (a1 is 0, h8 is 63). The array exposes the buffer protocol, so array libraries can
+    read it without copying, e.g. numpy.frombuffer(bitboards, dtype=numpy.uint64).
+
+    Args:
+        fen: The FEN to read. Only its board part is used and it is assumed to be
+            well formed apart from the characters checked below.
+
+    Returns:
+        array[int]: The 12 bitboards as unsigned 64-bit ints.
+
+    Raises:
+        InvalidFenBoardError: If the board part contains a character that is neither a
+            piece letter, a digit nor a rank separator.
+
+    """
+    bitboards = [0] * 12
+    piece_layers = _PIECE_LAYERS
+    square = 56  # the board part starts with the eighth rank, from the a-file
+    for character in fen.lstrip().partition(" ")[0]:
+        layer = piece_layers.get(character)
+        if layer is not None:
+            bitboards[layer] |= 1 << square
+            square += 1
+        elif character == "/":
+            square -= 16
+        elif "1" <= character <= "8":
+            square += ord(character) - 48
+        else:
+            raise InvalidFenBoardError(fen)
+    return array("Q", bitboards)
+
+
 def square_rotate(square: chess.Square) -> chess.Square:
     """Rotates the square 180."""
     return square ^ 0x3F
@@ -104,4 +216,8 @@ def square_rotate(square: chess.Square) -> chess.Square:
 
 def bitboard_rotate(bitboard: chess.Bitboard) -> chess.Bitboard:
     """Rotates the square 180."""
-    return chess.flip_horizontal(bb=chess.flip_vertical(bb=bitboard))
+    # a 180 rotation reverses the 64 bits: reverse the bits of each byte, then read the
+    # bytes in the opposite order
+    return int.from_bytes(
+        bitboard.to_bytes(8, "little").translate(_REVERSED_BITS), "big"
+    )
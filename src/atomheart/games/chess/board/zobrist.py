@@ -0,0 +1,126 @@
+"""Zobrist hashing of chess boards.
+
+A Zobrist hash XORs one fixed random 64-bit value per (color, piece, square) present
+on the board, plus values for the castling rights, the en passant file and the side
+to move. Because XOR is its own inverse, the hash of the position after a move is
+obtained from the hash before the move by XORing only the values of the squares that
+changed, which the board modifications already list.
+
+The board tag stays the exact BoardKey: a 64-bit hash can collide, which is fine for
+transposition tables but not for repetition counting.
+"""
+
+import random
+
+import chess
+from valanga import Color
+
+from .board_modification import BoardModificationP
+from .iboard import IBoard
+
+# fixed seed so that the hashes are stable across runs and processes
+_zobrist_random: random.Random = random.Random(0)
+
+# indexed as [color][piece type][square], index 0 of the piece types is unused
+_PIECE_SQUARE: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(
+        tuple(_zobrist_random.getrandbits(64) for _ in chess.SQUARES) for _ in range(7)
+    )
+    for _ in chess.COLORS
+)
+# castling rights are a bitboard of the rooks that may still castle
+_CASTLING_SQUARE: tuple[int, ...] = tuple(
+    _zobrist_random.getrandbits(64) for _ in chess.SQUARES
+)
+_EP_FILE: tuple[int, ...] = tuple(
+    _zobrist_random.getrandbits(64) for _ in chess.FILE_NAMES
+)
+_WHITE_TO_MOVE: int = _zobrist_random.getrandbits(64)
+
+
+def _castling_hash(castling_rights: chess.Bitboard) -> int:
+    key = 0
+    while castling_rights:
+        lowest_bit = castling_rights & -castling_rights
+        key ^= _CASTLING_SQUARE[lowest_bit.bit_length() - 1]
+        castling_rights ^= lowest_bit
+    return key
+
+
+def _ep_hash(ep_square: chess.Square | None) -> int:
+    return 0 if ep_square is None else _EP_FILE[ep_square & 7]
+
+
+def zobrist_hash(board: IBoard) -> int:
+    """Compute the Zobrist hash of a board from scratch.
+
+    Args:
+        board: The board to hash.
+
+    Returns:
+        int: The 64-bit Zobrist hash of the position.
+
+    """
+    key = 0
+    pieces: tuple[chess.Bitboard, ...] = (
+        board.pawns,
+        board.knights,
+        board.bishops,
+        board.rooks,
+        board.queens,
+        board.kings,
+    )
+    for color, occupied in ((chess.WHITE, board.white), (chess.BLACK, board.black)):
+        piece_square = _PIECE_SQUARE[color]
+        for piece_type, piece_bitboard in enumerate(pieces, start=1):
+            squares = piece_square[piece_type]
+            bitboard = piece_bitboard & occupied
+            while bitboard:
+                lowest_bit = bitboard & -bitboard
+                key ^= squares[lowest_bit.bit_length() - 1]
+                bitboard ^= lowest_bit
+
+    key ^= _castling_hash(board.castling_rights) ^ _ep_hash(board.ep_square)
+    if board.turn == Color.WHITE:
+        key ^= _WHITE_TO_MOVE
+    return key
+
+
+def update_zobrist_hash(
+    zobrist_key: int,
+    board_modification: BoardModificationP,
+    previous_castling_rights: chess.Bitboard,
+    previous_ep_square: chess.Square | None,
+    castling_rights: chess.Bitboard,
+    ep_square: chess.Square | None,
+) -> int:
+    """Return the Zobrist hash after a move from the hash before it.
+
+    Args:
+        zobrist_key: The Zobrist hash of the position before the move.
+        board_modification: The modifications made to the board by the move.
+        previous_castling_rights: The castling rights before the move.
+        previous_ep_square: The en passant square before the move.
+        castling_rights: The castling rights after the move.
+        ep_square: The en passant square after the move.
+
+    Returns:
+        int: The Zobrist hash of the position after the move.
+
+    """
+    for removal in board_modification.removals:
+        zobrist_key ^= _PIECE_SQUARE[removal.color][removal.piece][removal.square]
+    for appearance in board_modification.appearances:
+        zobrist_key ^= _PIECE_SQUARE[appearance.color][appearance.piece][
+            appearance.square
+        ]
+    if previous_castling_rights != castling_rights:
+        zobrist_key ^= _castling_hash(previous_castling_rights) ^ _castling_hash(
+            castling_rights
+        )
+    return (
+        zobrist_key
+        ^ _ep_hash(previous_ep_square)
+        ^ _ep_hash(ep_square)
+        ^ _WHITE_TO_MOVE
+    )
@@ -1,18 +1,35 @@
 """Chess dynamics/rules for Valanga."""
 
-from typing import TYPE_CHECKING, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, cast
 
 import valanga
 
 from .state import ChessState
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     import chess
 
-    from atomheart.games.chess.board.iboard import IBoard
     from atomheart.games.chess.move.imove import MoveKey
 
 
+# info of every transition to a non terminal position, shared read-only rather than
+# building the same dict on each step
+_NOT_OVER_INFO: MappingProxyType[str, Any] = MappingProxyType(
+    {"result": "*", "termination": None}
+)
+
+
+# outcome and winner of each terminal result reported by the boards
+_RESULT_OUTCOMES: dict[str, tuple[valanga.Outcome, valanga.Color | None]] = {
+    "1-0": (valanga.Outcome.WIN, valanga.Color.WHITE),
+    "0-1": (valanga.Outcome.WIN, valanga.Color.BLACK),
+    "1/2-1/2": (valanga.Outcome.DRAW, None),
+}
+
+
 class UnsupportedTerminalChessResultError(ValueError):
     """Raised when a terminal chess board reports an unknown result string."""
 
@@ -32,29 +49,49 @@ class ChessDynamics(valanga.Dynamics[ChessState]):
         return state.board.legal_moves
 
     def step(
-        self, state: ChessState, action: valanga.BranchKey
+        self, state: ChessState, action: valanga.BranchKey, *, consume: bool = False
     ) -> valanga.Transition[ChessState]:
-        """Copy and advance the board with ``action``."""
+        """Copy and advance the board with ``action``.
+
+        Args:
+            state: The state to advance.
+            action: The move key to play.
+            consume: Whether to play the move on the board of ``state`` itself rather
+                than on a copy. The copy of the board, its move stack and its legal
+                moves is then saved, but ``state`` must not be used afterwards (as in a
+                playout, where each state only ever has one child).
+
+        Returns:
+            The transition to the state after the move.
+
+        """
         move_key = cast("MoveKey", action)
 
-        board2 = state.board.copy(stack=True, deep_copy_legal_moves=True)
+        board2 = (
+            state.board
+            if consume
+            else state.board.copy(stack=True, deep_copy_legal_moves=True)
+        )
         mods = board2.play_move_key(move_key)
         is_over = board2.is_game_over()
 
         over_event: valanga.OverEvent[valanga.Role] | None = None
+        info: Mapping[str, Any] = _NOT_OVER_INFO
         if is_over:
-            over_event = _over_event_from_board(board2)
+            # each of result and termination checks the end of game rules again, so
+            # they are asked once and shared by the over event and the info
+            result = board2.result(claim_draw=True)
+            # Only compute termination when game is over; otherwise it may assert.
+            termination = board2.termination()
+            over_event = _over_event_from_result(result, termination)
+            info = {"result": result, "termination": termination}
 
         return valanga.Transition(
             next_state=ChessState(board2),
             modifications=mods,
             is_over=is_over,
             over_event=over_event,
-            info={
-                "result": board2.result(claim_draw=True) if is_over else "*",
-                # Only compute termination when game is over; otherwise it may assert.
-                "termination": board2.termination() if is_over else None,
-            },
+            info=info,
         )
 
     def action_name(self, state: ChessState, action: valanga.BranchKey) -> str:
@@ -66,30 +103,12 @@ class ChessDynamics(valanga.Dynamics[ChessState]):
         return state.board.get_move_key_from_uci(name)
 
 
-def _over_event_from_board(board: "IBoard") -> valanga.OverEvent[valanga.Role]:
+def _over_event_from_result(
+    result: str, termination: "chess.Termination | None"
+) -> valanga.OverEvent[valanga.Role]:
     """Convert board end-of-game info into a Valanga over event."""
-    result = board.result(claim_draw=True)
-    termination: chess.Termination | None = board.termination()
-
-    if result == "1-0":
-        return valanga.OverEvent(
-            outcome=valanga.Outcome.WIN,
-            termination=termination,
-            winner=valanga.Color.WHITE,
-        )
-
-    if result == "0-1":
-        return valanga.OverEvent(
-            outcome=valanga.Outcome.WIN,
-            termination=termination,
-            winner=valanga.Color.BLACK,
-        )
-
-    if result == "1/2-1/2":
-        return valanga.OverEvent(
-            outcome=valanga.Outcome.DRAW,
-            termination=termination,
-            winner=None,
-        )
-
-    raise UnsupportedTerminalChessResultError.for_result(result)
+    outcome_and_winner = _RESULT_OUTCOMES.get(result)
+    if outcome_and_winner is None:
+        raise UnsupportedTerminalChessResultError.for_result(result)
+    outcome, winner = outcome_and_winner
+    return valanga.OverEvent(outcome=outcome, termination=termination, winner=winner)
@@ -3,14 +3,20 @@
 from importlib.util import find_spec
 
 from .imove import IMove
-from .move_factory import MoveFactory, create_move_factory
-from .utils import MoveUci
+from .move_factory import (
+    MoveFactory,
+    create_board_move_factory,
+    create_move_factory,
+)
+from .utils import MoveUci, intern_uci
 
 __all__ = [
     "IMove",
     "MoveFactory",
     "MoveUci",
+    "create_board_move_factory",
     "create_move_factory",
+    "intern_uci",
 ]
 
 if find_spec("shakmaty_python_binding") is not None:
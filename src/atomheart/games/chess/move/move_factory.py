@@ -3,11 +3,14 @@
 
 from __future__ import annotations
 
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Protocol
 
 import chess
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import shakmaty_python_binding
 
     from atomheart.games.chess.board.iboard import IBoard
@@ -44,6 +47,39 @@ def create_move_factory(
     return move_factory
 
 
+def create_board_move_factory(board: IBoard) -> Callable[[MoveUci], IMove]:
+    """Create a move factory bound to a board.
+
+    The kind of board is checked once here rather than on each move, so the returned
+    factory only builds the move from its UCI string.
+
+    Args:
+        board (IBoard): The board on which the moves are made.
+
+    Returns:
+        Callable[[MoveUci], IMove]: The function creating a move from its UCI string.
+
+    """
+    if find_spec("shakmaty_python_binding") is not None:
+        import shakmaty_python_binding  # pylint: disable=import-outside-toplevel
+
+        from atomheart.games.chess.board.rusty_board import (  # pylint: disable=import-outside-toplevel
+            RustyBoardChi,
+        )
+
+        if isinstance(board, RustyBoardChi):
+            rusty_board: RustyBoardChi = board
+            my_move = shakmaty_python_binding.MyMove
+
+            def create_bound_rust_move(move_uci: MoveUci) -> IMove:
+                # the position is read on each call as unmake_move rebinds it
+                return my_move(move_uci, rusty_board.chess_)
+
+            return create_bound_rust_move
+
+    return chess.Move.from_uci
+
+
 def create_rust_move(
     move_uci: MoveUci,
     board: RustyBoardChi | None = None,
@@ -2,15 +2,21 @@
 
 import shakmaty_python_binding
 
-from .utils import MoveUci
+from .utils import MoveUci, intern_uci
 
 
 class RustMove:
     """RustMove class wrapping a Rust-based move representation."""
 
+    # many moves are alive at once in a search tree: no instance dict
+    __slots__ = ("is_zeroing_", "move", "uci_")
+
     move: shakmaty_python_binding.MyMove
     uci_: MoveUci
 
+    # answer of the binding to is_zeroing, asked once as the move never changes
+    is_zeroing_: bool | None
+
     def __init__(self, move: shakmaty_python_binding.MyMove, uci: MoveUci) -> None:
         """Initialize a RustMove instance.
 
@@ -20,7 +26,8 @@ class RustMove:
 
         """
         self.move = move
-        self.uci_ = uci
+        self.uci_ = intern_uci(uci)
+        self.is_zeroing_ = None
 
     def is_zeroing(self) -> bool:
         """Zeroing moves are moves that reset the fifty-move counter.
@@ -29,7 +36,10 @@ class RustMove:
             bool: True if the move is zeroing, False otherwise.
 
         """
-        return self.move.is_zeroing()
+        is_zeroing = self.is_zeroing_
+        if is_zeroing is None:
+            is_zeroing = self.is_zeroing_ = self.move.is_zeroing()
+        return is_zeroing
 
     def uci(self) -> MoveUci:
         """Get the UCI string representation of the move.
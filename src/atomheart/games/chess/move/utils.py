@@ -1,7 +1,25 @@
 """Utilities for move UCI representation."""
 
+import sys
 from typing import Annotated
 
 type MoveUci = Annotated[str, "a string representing a move uci"]
 
+
+def intern_uci(move_uci: str) -> MoveUci:
+    """Return the shared string object equal to a move uci.
+
+    There are fewer than 2000 distinct move ucis in chess, so interning them makes the
+    ucis stored across a search tree share a few objects, and compare by identity first.
+
+    Args:
+        move_uci (str): The UCI string of the move.
+
+    Returns:
+        MoveUci: The interned UCI string.
+
+    """
+    return sys.intern(move_uci)
+
+
 type HalfMove = Annotated[int, "an integer representing a half move"]
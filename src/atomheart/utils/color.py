@@ -3,12 +3,21 @@
 import chess
 from valanga import Color as ValangaColor
 
+# valanga color of each python-chess color, indexed by the color as a bool (BLACK is False)
+_VALANGA_COLORS: tuple[ValangaColor, ValangaColor] = (
+    ValangaColor.BLACK,
+    ValangaColor.WHITE,
+)
+
+# python-chess color of each valanga color, indexed by the color as an int (BLACK is 0)
+_CHESS_COLORS: tuple[chess.Color, chess.Color] = (chess.BLACK, chess.WHITE)
+
 
 def chess_color_to_valanga(color: chess.Color) -> ValangaColor:
     """Convert python-chess color (bool) to valanga Color."""
-    return ValangaColor.WHITE if color == chess.WHITE else ValangaColor.BLACK
+    return _VALANGA_COLORS[color]
 
 
 def valanga_color_to_chess(color: ValangaColor) -> chess.Color:
     """Convert valanga Color to python-chess color (bool)."""
-    return chess.WHITE if color == ValangaColor.WHITE else chess.BLACK
+    return _CHESS_COLORS[color]
@@ -1,12 +1,16 @@
 """Test board."""
 
+import io
 from typing import TYPE_CHECKING
 
 import chess
 import pytest
+import yaml
 
-from atomheart.games.chess.board import Fen, IBoard, create_board
+from atomheart.games.chess.board import BoardChi, Fen, IBoard, create_board
+from atomheart.games.chess.board.iboard import BoardInvariantError
 from atomheart.games.chess.board.utils import FenPlusHistory
+from atomheart.games.chess.move import create_board_move_factory
 
 if TYPE_CHECKING:
     from atomheart.games.chess.move import MoveUci
@@ -75,8 +79,217 @@ def test_move(use_rusty_board: bool) -> None:
         assert board.fen == fen_next
 
 
+@pytest.mark.parametrize(("use_rusty_board"), (True, False))
+def test_tag_after_move(use_rusty_board: bool) -> None:
+    """Test that the tag after a move is the tag of a board created directly in the resulting position."""
+    board: IBoard = create_board(
+        use_rust_boards=use_rusty_board,
+        fen_with_history=FenPlusHistory(current_fen=chess.STARTING_FEN),
+    )
+    tag_before_move = board.tag
+
+    board.play_move_key(move=board.get_move_key_from_uci(move_uci="g1f3"))
+
+    board_after_move: IBoard = create_board(
+        use_rust_boards=use_rusty_board,
+        fen_with_history=FenPlusHistory(current_fen=board.fen),
+    )
+    assert board.tag == board_after_move.tag
+    assert board.tag != tag_before_move
+
+
+@pytest.mark.parametrize(("use_rusty_board"), (True, False))
+def test_move_counters(use_rusty_board: bool) -> None:
+    """Test that the move counters follow the moves played."""
+    board: IBoard = create_board(use_rust_boards=use_rusty_board)
+    for move_uci in ["g1f3", "d7d5", "f3e5", "b8c6", "e5c6", "b7c6", "b1c3"]:
+        board.play_move_uci(move_uci=move_uci)
+        _, _, _, _, halfmove_clock, fullmove_number = board.fen.split()
+        assert board.halfmove_clock == int(halfmove_clock)
+        assert board.fullmove_number == int(fullmove_number)
+
+
+def test_dump() -> None:
+    """Test that the dumped board holds the current FEN and the moves played."""
+    board: IBoard = create_board(use_rust_boards=False)
+    for move_uci in ["e2e4", "e7e5", "g1f3"]:
+        board.play_move_uci(move_uci=move_uci)
+
+    file = io.StringIO()
+    board.dump(file)
+
+    assert yaml.safe_load(file.getvalue()) == {
+        "current_fen": board.fen,
+        "historical_moves": ["e2e4", "e7e5", "g1f3"],
+    }
+
+
+@pytest.mark.parametrize(("use_rusty_board"), (True, False))
+def test_move_key_from_uci(use_rusty_board: bool) -> None:
+    """Test that the move keys found from UCI strings follow the moves played."""
+    board: IBoard = create_board(use_rust_boards=use_rusty_board)
+
+    for move_key in board.legal_moves.get_all():
+        move_uci = board.legal_moves.get_uci_from_move_key(move_key)
+        assert board.get_move_key_from_uci(move_uci=move_uci) == move_key
+
+    board.play_move_uci(move_uci="e2e4")
+    assert len(list(board.legal_moves)) == 20
+    move_key = board.get_move_key_from_uci(move_uci="e7e5")
+    assert board.legal_moves.get_uci_from_move_key(move_key) == "e7e5"
+
+    with pytest.raises(BoardInvariantError):
+        board.get_move_key_from_uci(move_uci="e2e4")
+
+
+@pytest.mark.parametrize(("use_rusty_board"), (True, False))
+def test_history_snapshot(use_rusty_board: bool) -> None:
+    """Test that the move history handed out is not changed by the moves played later."""
+    board: IBoard = create_board(use_rust_boards=use_rusty_board)
+    board.play_move_uci(move_uci="e2e4")
+    move_history_stack = board.move_history_stack
+    fen_plus_history = board.into_fen_plus_history()
+
+    board.play_move_uci(move_uci="e7e5")
+    assert list(move_history_stack) == ["e2e4"]
+    assert list(fen_plus_history.historical_moves) == ["e2e4"]
+    assert list(board.move_history_stack) == ["e2e4", "e7e5"]
+
+    # the record holds ucis only, so even a python-chess board can be rebuilt from it
+    rebuilt = create_board(use_rust_boards=False, fen_with_history=fen_plus_history)
+    assert list(rebuilt.move_history_stack) == ["e2e4"]
+
+
+@pytest.mark.parametrize(("use_rusty_board"), (True, False))
+def test_board_move_factory(use_rusty_board: bool) -> None:
+    """Test that the move factory bound to a board creates the moves of that board."""
+    board: IBoard = create_board(use_rust_boards=use_rusty_board)
+    move_factory = create_board_move_factory(board)
+
+    for move_uci in ["e2e4", "e7e5", "g1f3"]:
+        assert move_factory(move_uci).uci() == move_uci
+        board.play_move_uci(move_uci=move_uci)
+    assert move_factory("b8c6").uci() == "b8c6"
+
+
+def test_uci_after_rewind() -> None:
+    """Test that the ucis of the move keys follow the board when it is rewound."""
+    board = create_board(use_rust_boards=False)
+    assert isinstance(board, BoardChi)
+    board.play_move_uci(move_uci="e2e4")
+    list(board.legal_moves)
+    assert board.legal_moves.get_uci_from_move_key(0) == "g8h6"
+    board.get_move_key_from_uci(move_uci="e7e5")
+
+    board.rewind_one_move()
+    list(board.legal_moves)
+    for move_key, chess_move in board.legal_moves.generated_moves.items():
+        assert board.legal_moves.get_uci_from_move_key(move_key) == chess_move.uci()
+    assert len(board.legal_moves.get_all()) == 20
+    move_key = board.get_move_key_from_uci(move_uci="d2d4")
+    assert board.legal_moves.get_uci_from_move_key(move_key) == "d2d4"
+    with pytest.raises(BoardInvariantError):
+        board.get_move_key_from_uci(move_uci="e7e5")
+
+
+@pytest.mark.parametrize(("use_rusty_board"), (True, False))
+def test_threefold_repetition(use_rusty_board: bool) -> None:
+    """Test that shuffling the knights back and forth ends the game by repetition."""
+    board: IBoard = create_board(use_rust_boards=use_rusty_board)
+    shuffle: list[MoveUci] = ["g1f3", "g8f6", "f3g1", "f6g8"]
+
+    for move_uci in shuffle:
+        board.play_move_uci(move_uci=move_uci)
+    assert not board.is_game_over()
+
+    board = board.copy(stack=True)
+    for move_uci in shuffle:
+        board.play_move_uci(move_uci=move_uci)
+    assert board.is_game_over()
+    assert board.result(claim_draw=True) == "1/2-1/2"
+
+
+def test_make_unmake_move() -> None:
+    """Test that unmaking moves made on the Rust board gives back the original board."""
+    board: IBoard = create_board(use_rust_boards=True)
+    from atomheart.games.chess.board.rusty_board import (  # pylint: disable=import-outside-toplevel
+        RustyBoardChi,
+    )
+
+    assert isinstance(board, RustyBoardChi)
+    board.play_move_uci(move_uci="e2e4")
+    fen, tag, moves = board.fen, board.tag, list(board.legal_moves.get_all())
+    move_stack = list(board.move_history_stack)
+    rep_to_count = board.rep_to_count.copy()
+
+    undos = []
+    for move_uci in ["e7e5", "g1f3", "b8c6"]:
+        move_key = board.get_move_key_from_uci(move_uci=move_uci)
+        assert board.legal_moves.generated_moves is not None
+        undo, _ = board.make_move(board.legal_moves.generated_moves[move_key])
+        undos.append(undo)
+    assert board.fen != fen
+
+    for undo in reversed(undos):
+        board.unmake_move(undo)
+    assert board.fen == fen
+    assert board.tag == tag
+    assert list(board.legal_moves.get_all()) == moves
+    assert board.move_history_stack == move_stack
+    assert board.rep_to_count == rep_to_count
+
+
+def test_maybe_terminal() -> None:
+    """Test that the Rust board knows the game is over after a repetition or a mate."""
+    board: IBoard = create_board(use_rust_boards=True)
+    from atomheart.games.chess.board.rusty_board import (  # pylint: disable=import-outside-toplevel
+        RustyBoardChi,
+    )
+
+    assert isinstance(board, RustyBoardChi)
+    for move_uci in ["g1f3", "g8f6", "f3g1", "f6g8"] * 2:
+        assert not board.maybe_terminal()
+        board.play_move_uci(move_uci=move_uci)
+    assert board.maybe_terminal()
+
+    board = create_board(
+        use_rust_boards=True,
+        fen_with_history=FenPlusHistory(
+            current_fen="rnbqkbnr/ppppp2p/5p2/6p1/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 3"
+        ),
+    )
+    assert isinstance(board, RustyBoardChi)
+    board.play_move_uci(move_uci="d1h5")
+    assert not board.maybe_terminal()
+    assert board.is_game_over()
+    assert board.maybe_terminal()
+
+
+def test_rust_move_keys_shared_safely() -> None:
+    """Test that the move keys shared between Rust generators cannot be changed by a caller."""
+    board: IBoard = create_board(use_rust_boards=True)
+    copy_board: IBoard = board.copy(stack=False)
+    move_keys = board.legal_moves.get_all()
+    assert isinstance(move_keys, tuple)
+    assert list(copy_board.legal_moves.get_all()) == list(range(20))
+
+    sorted_board: IBoard = create_board(use_rust_boards=True, sort_legal_moves=True)
+    assert isinstance(sorted_board.legal_moves.get_all(), tuple)
+
+
 if __name__ == "__main__":
     use_rusty_board: bool
     for use_rusty_board in [True, False]:
         test_copy(use_rusty_board=use_rusty_board)
         test_move(use_rusty_board=use_rusty_board)
+        test_tag_after_move(use_rusty_board=use_rusty_board)
+        test_move_counters(use_rusty_board=use_rusty_board)
+        test_move_key_from_uci(use_rusty_board=use_rusty_board)
+        test_threefold_repetition(use_rusty_board=use_rusty_board)
+        test_history_snapshot(use_rusty_board=use_rusty_board)
+        test_board_move_factory(use_rusty_board=use_rusty_board)
+    test_uci_after_rewind()
+    test_make_unmake_move()
+    test_maybe_terminal()
+    test_rust_move_keys_shared_safely()
+    test_dump()
@@ -1,5 +1,6 @@
 """Test the board modifications when playing a move on the board."""
 
+from array import array
 from typing import TYPE_CHECKING
 
 import chess
@@ -13,8 +14,12 @@ from atomheart.games.chess.board import (
     create_board_chi,
 )
 from atomheart.games.chess.board.board_modification import (
+    BitboardSnapshot,
+    BoardModification,
     PieceInSquare,
     compute_modifications,
+    compute_modifications_batch,
+    pack_board_modifications,
 )
 from atomheart.games.chess.board.utils import FenPlusHistory
 from atomheart.games.chess.move import MoveUci
@@ -152,8 +157,101 @@ def test_compute_modifications() -> None:
         assert set(board_modifications_2.appearances) == set(appearances)
 
 
+def test_lazy_modifications() -> None:
+    """Test that the modifications diffed lazily from the board snapshots are the expected ones."""
+    for fen_original, move_uci, removals, appearances in examples:
+        board_chi: BoardChi = create_board_chi(
+            fen_with_history=FenPlusHistory(current_fen=fen_original),
+            use_board_modification=True,
+        )
+        board_modification = board_chi.play_move(
+            move=chess.Move.from_uci(move_uci), use_compute_modification_function=True
+        )
+        assert board_modification is not None
+
+        assert set(board_modification.removals) == set(removals)
+        assert set(board_modification.appearances) == set(appearances)
+
+
+def _snapshot(board_chi: "BoardChi") -> BitboardSnapshot:
+    chess_board = board_chi.chess_board
+    return array(
+        "Q",
+        (
+            chess_board.pawns,
+            chess_board.knights,
+            chess_board.bishops,
+            chess_board.rooks,
+            chess_board.queens,
+            chess_board.kings,
+            chess_board.occupied_co[chess.BLACK],
+            chess_board.occupied_co[chess.WHITE],
+        ),
+    )
+
+
+def test_compute_modifications_batch() -> None:
+    """Test that the batch computation gives the expected modifications for every pair of states."""
+    previous_snapshots: list[BitboardSnapshot] = []
+    new_snapshots: list[BitboardSnapshot] = []
+
+    for fen_original, move_uci, _, _ in examples:
+        board_chi: BoardChi = create_board_chi(
+            fen_with_history=FenPlusHistory(current_fen=fen_original),
+            sort_legal_moves=True,
+        )
+        previous_snapshots.append(_snapshot(board_chi))
+        board_chi.play_move_key(move=board_chi.get_move_key_from_uci(move_uci=move_uci))
+        new_snapshots.append(_snapshot(board_chi))
+
+    board_modifications = compute_modifications_batch(
+        previous_snapshots=previous_snapshots, new_snapshots=new_snapshots
+    )
+
+    assert len(board_modifications) == len(examples)
+    for board_modification, (_, _, removals, appearances) in zip(
+        board_modifications, examples, strict=True
+    ):
+        assert set(board_modification.removals) == set(removals)
+        assert set(board_modification.appearances) == set(appearances)
+
+    packed = pack_board_modifications(board_modifications)
+    for i, (_, _, removals, appearances) in enumerate(examples):
+        packed_removals = packed.removals[
+            packed.removal_offsets[i] : packed.removal_offsets[i + 1]
+        ]
+        packed_appearances = packed.appearances[
+            packed.appearance_offsets[i] : packed.appearance_offsets[i + 1]
+        ]
+        assert set(map(PieceInSquare.decode, packed_removals)) == set(removals)
+        assert set(map(PieceInSquare.decode, packed_appearances)) == set(appearances)
+
+
+def test_board_modification_cache() -> None:
+    """Test that the cached removals and appearances follow the pieces added."""
+    board_modification = BoardModification()
+    board_modification.add_removal(PieceInSquare(chess.E2, chess.PAWN, chess.WHITE))
+    assert board_modification.removals == (
+        PieceInSquare(chess.E2, chess.PAWN, chess.WHITE),
+    )
+    assert board_modification.removals is board_modification.removals
+
+    board_modification.add_removal(PieceInSquare(chess.D5, chess.PAWN, chess.BLACK))
+    board_modification.add_appearance(PieceInSquare(chess.D5, chess.PAWN, chess.WHITE))
+    assert board_modification.removals == (
+        PieceInSquare(chess.E2, chess.PAWN, chess.WHITE),
+        PieceInSquare(chess.D5, chess.PAWN, chess.BLACK),
+    )
+    assert board_modification.appearances == (
+        PieceInSquare(chess.D5, chess.PAWN, chess.WHITE),
+    )
+
+
 if __name__ == "__main__":
     test_compute_modifications()
+    test_lazy_modifications()
+    test_compute_modifications_batch()
+    test_board_modification_cache()
     use_rusty_board: bool
     for use_rusty_board in [True, False]:
         test_modifications(use_rust_boards=use_rusty_board)
@@ -8,6 +8,7 @@ These tests ensure:
 
 import chess
 import pytest
+import valanga
 
 from atomheart import ChessDynamics, ChessState
 from atomheart.games.chess.board import IBoard, create_board
@@ -33,6 +34,7 @@ def test_step_non_terminal_position(use_rust_boards: bool) -> None:
     assert transition.next_state is not None
     assert transition.is_over is False
     assert transition.over_event is None
+    assert transition.info == {"result": "*", "termination": None}
 
     # Make sure resulting board is still non-terminal
     assert transition.next_state.board.is_game_over() is False
@@ -59,6 +61,12 @@ def test_step_terminal_position_mate_in_one(use_rust_boards: bool) -> None:
     assert transition.next_state is not None
     assert transition.is_over is True
     assert transition.next_state.board.is_game_over() is True
+    assert transition.over_event is not None
+    assert transition.over_event.winner == valanga.Color.WHITE
+    assert transition.info == {
+        "result": "1-0",
+        "termination": transition.over_event.termination,
+    }
 
 
 @pytest.mark.parametrize("use_rust_boards", [False, True])
@@ -86,3 +94,27 @@ def test_step_multiple_moves_sequence(use_rust_boards: bool) -> None:
         current_state = transition.next_state
 
     assert current_state.board.is_game_over() is False
+
+
+@pytest.mark.parametrize("use_rust_boards", [False, True])
+def test_step_consume(use_rust_boards: bool) -> None:
+    """step(consume=True) must reach the same states as step() without copying the board."""
+    moves = ["e2e4", "e7e5", "g1f3", "b8c6"]
+    dyn = ChessDynamics()
+
+    copied_state = ChessState(board=create_board(use_rust_boards=use_rust_boards))
+    consumed_state = ChessState(board=create_board(use_rust_boards=use_rust_boards))
+    for move in moves:
+        board = consumed_state.board
+        copied = dyn.step(copied_state, dyn.action_from_name(copied_state, move))
+        consumed = dyn.step(
+            consumed_state, dyn.action_from_name(consumed_state, move), consume=True
+        )
+
+        assert consumed.next_state.board is board
+        assert consumed.next_state.tag == copied.next_state.tag
+        assert consumed.next_state.board.fen == copied.next_state.board.fen
+        assert consumed.is_over == copied.is_over
+        copied_state, consumed_state = copied.next_state, consumed.next_state
+
+    assert consumed_state.board.move_history_stack == moves
@@ -0,0 +1,133 @@
+"""Test the utilities on FEN strings."""
+
+from dataclasses import asdict
+
+import chess
+import pytest
+
+from atomheart.games.chess.board.utils import (
+    ROTATED_SQUARES,
+    EmptyFenError,
+    FenFields,
+    FenPlusHistory,
+    InvalidFenBoardError,
+    InvalidFenFieldsError,
+    InvalidFenTurnError,
+    bitboard_rotate,
+    fen_to_bitboards,
+    parse_fen_fields,
+    square_rotate,
+)
+from atomheart.games.chess.move.utils import intern_uci
+
+
+@pytest.mark.parametrize(
+    ("fen", "turn"),
+    [
+        (chess.STARTING_FEN, chess.WHITE),
+        ("rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1", chess.BLACK),
+        ("8/8/8/8/8/8/8/K6k b", chess.BLACK),
+        ("  8/8/8/8/8/8/8/K6k   b  - - 0 1", chess.BLACK),
+        ("8/8/8/8/8/8/8/K6k", chess.WHITE),
+    ],
+)
+def test_current_turn(fen: str, turn: chess.Color) -> None:
+    """Test that the turn is read from the FEN, whatever its spacing."""
+    assert FenPlusHistory(current_fen=fen).current_turn() == turn
+
+
+def test_current_turn_errors() -> None:
+    """Test that invalid FENs raise the FEN errors."""
+    with pytest.raises(EmptyFenError):
+        FenPlusHistory(current_fen="  ").current_turn()
+    with pytest.raises(InvalidFenTurnError):
+        FenPlusHistory(current_fen="8/8/8/8/8/8/8/K6k x - - 0 1").current_turn()
+    with pytest.raises(InvalidFenTurnError):
+        FenPlusHistory(current_fen="8/8/8/8/8/8/8/K6k wb - - 0 1").current_turn()
+
+
+def test_current_turn_follows_fen() -> None:
+    """Test that the turn follows the FEN when it is replaced."""
+    fen_plus_history = FenPlusHistory(current_fen=chess.STARTING_FEN)
+    assert fen_plus_history.current_turn() == chess.WHITE
+    assert fen_plus_history.current_turn() == chess.WHITE
+    fen_plus_history.current_fen = "8/8/8/8/8/8/8/K6k b - - 0 1"
+    assert fen_plus_history.current_turn() == chess.BLACK
+    assert fen_plus_history == FenPlusHistory(current_fen="8/8/8/8/8/8/8/K6k b - - 0 1")
+    assert FenPlusHistory(**asdict(fen_plus_history)) == fen_plus_history
+
+
+def test_bitboard_rotate() -> None:
+    """Test that rotating a bitboard matches flipping it both ways and rotating its squares."""
+    bitboards = [
+        0,
+        chess.BB_ALL,
+        chess.BB_A1,
+        chess.BB_H8,
+        chess.BB_RANK_2 | chess.BB_E4,
+        0x0123456789ABCDEF,
+    ]
+    for bitboard in bitboards:
+        rotated = bitboard_rotate(bitboard)
+        assert rotated == chess.flip_horizontal(chess.flip_vertical(bitboard))
+        assert rotated == sum(
+            chess.BB_SQUARES[square_rotate(square)]
+            for square in chess.scan_forward(bitboard)
+        )
+        assert bitboard_rotate(rotated) == bitboard
+
+
+def test_rotated_squares() -> None:
+    """Test that the table of rotated squares matches square_rotate."""
+    assert tuple(square_rotate(square) for square in chess.SQUARES) == ROTATED_SQUARES
+    assert ROTATED_SQUARES[chess.A1] == chess.H8
+    assert ROTATED_SQUARES[chess.E2] == chess.D7
+
+
+def test_intern_uci() -> None:
+    """Test that equal move ucis built separately are interned to the same object."""
+    move_uci = "".join(["e2", "e4"])
+    assert intern_uci(move_uci) is intern_uci("e2" + "e4".lower()) is intern_uci("e2e4")
+
+
+@pytest.mark.parametrize(
+    "fen",
+    [
+        chess.STARTING_FEN,
+        "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4",
+        "8/5P2/8/3k4/7K/8/8/8 w - - 0 1",
+    ],
+)
+def test_fen_to_bitboards(fen: str) -> None:
+    """Test that the bitboards read from the FEN match the ones of the chess board."""
+    board = chess.Board(fen)
+    expected = [
+        board.pieces_mask(piece_type, color)
+        for color in (chess.WHITE, chess.BLACK)
+        for piece_type in chess.PIECE_TYPES
+    ]
+    assert list(fen_to_bitboards(fen)) == expected
+
+
+def test_fen_to_bitboards_errors() -> None:
+    """Test that an invalid character in the board part raises a FEN error."""
+    with pytest.raises(InvalidFenBoardError):
+        fen_to_bitboards("8/8/8/8/8/8/8/K6x w - - 0 1")
+
+
+def test_parse_fen_fields() -> None:
+    """Test that the six fields of a FEN are read in one go."""
+    assert parse_fen_fields(
+        "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2"
+    ) == FenFields(
+        board="rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR",
+        turn=chess.WHITE,
+        castling="KQkq",
+        ep_square="e6",
+        halfmove_clock=0,
+        fullmove_number=2,
+    )
+    assert parse_fen_fields(" 8/8/8/8/8/8/8/K6k  b - -  12 40 ").turn == chess.BLACK
+    for fen in ["", "8/8/8/8/8/8/8/K6k b", "8/8/8/8/8/8/8/K6k x - - 0 1"]:
+        with pytest.raises(InvalidFenFieldsError):
+            parse_fen_fields(fen)
@@ -0,0 +1,58 @@
+"""Test the Zobrist hashing of the boards."""
+
+import chess
+import pytest
+
+from atomheart.games.chess.board import IBoard, create_board
+from atomheart.games.chess.board.utils import FenPlusHistory
+from atomheart.games.chess.board.zobrist import update_zobrist_hash, zobrist_hash
+
+games: list[tuple[str, list[str]]] = [
+    (chess.STARTING_FEN, ["e2e4", "d7d5", "e4d5", "g8f6", "f1b5", "c7c6", "g1f3"]),
+    (
+        "rnbqkbnr/ppp3pp/3ppp2/8/8/4PN2/PPPPBPPP/RNBQK2R w KQkq - 0 4",
+        ["e1g1", "e8f7", "d2d4", "g7g5"],
+    ),
+    ("8/5P2/8/3k4/7K/8/8/8 w - - 0 1", ["f7f8q", "d5e4"]),
+]
+
+
+@pytest.mark.parametrize(("use_rust_boards"), (True, False))
+def test_incremental_zobrist_hash(use_rust_boards: bool) -> None:
+    """Test that updating the hash with the board modifications matches a full recomputation."""
+    for fen, moves in games:
+        board: IBoard = create_board(
+            use_rust_boards=use_rust_boards,
+            use_board_modification=True,
+            fen_with_history=FenPlusHistory(current_fen=fen),
+        )
+        zobrist_key = zobrist_hash(board)
+
+        for move_uci in moves:
+            previous_castling_rights = board.castling_rights
+            previous_ep_square = board.ep_square
+            board_modification = board.play_move_uci(move_uci=move_uci)
+            assert board_modification is not None
+
+            zobrist_key = update_zobrist_hash(
+                zobrist_key=zobrist_key,
+                board_modification=board_modification,
+                previous_castling_rights=previous_castling_rights,
+                previous_ep_square=previous_ep_square,
+                castling_rights=board.castling_rights,
+                ep_square=board.ep_square,
+            )
+            assert zobrist_key == zobrist_hash(board)
+
+
+def test_zobrist_hash_transposition() -> None:
+    """Test that the same position reached by different move orders has the same hash."""
+    board_1: IBoard = create_board()
+    board_2: IBoard = create_board()
+    for move_uci in ["g1f3", "g8f6", "b1c3"]:
+        board_1.play_move_uci(move_uci=move_uci)
+    for move_uci in ["b1c3", "g8f6", "g1f3"]:
+        board_2.play_move_uci(move_uci=move_uci)
+
+    assert zobrist_hash(board_1) == zobrist_hash(board_2)
+    assert zobrist_hash(board_1) != zobrist_hash(create_board())
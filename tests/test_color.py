@@ -0,0 +1,16 @@
+"""Test the color conversions between python-chess and valanga."""
+
+import chess
+from valanga import Color
+
+from atomheart.utils.color import chess_color_to_valanga, valanga_color_to_chess
+
+
+def test_color_conversions() -> None:
+    """Test that the colors convert both ways."""
+    assert chess_color_to_valanga(chess.WHITE) is Color.WHITE
+    assert chess_color_to_valanga(chess.BLACK) is Color.BLACK
+    assert valanga_color_to_chess(Color.WHITE) is chess.WHITE
+    assert valanga_color_to_chess(Color.BLACK) is chess.BLACK
+    for color in Color:
+        assert chess_color_to_valanga(valanga_color_to_chess(color)) is color